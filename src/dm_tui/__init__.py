@@ -1,3 +1,20 @@
 """dm-tui package."""
 
-__all__ = []
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import DmTuiApp, run
+
+__all__ = ["DmTuiApp", "run"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the Textual app lazily so ``import dm_tui`` stays lightweight."""
+
+    if name in __all__:
+        from . import app
+
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,46 +2,49 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import os
+import re
 import threading
 from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from time import monotonic
-from typing import TYPE_CHECKING, Deque, Dict, Iterable, Mapping, Optional
+from time import monotonic, strftime
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional, Sequence, TypeVar
 
 from textual.app import App, ComposeResult, ScreenStackError
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.events import Mount
+from textual.events import Mount, Resize
+from textual.message import Message
 from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.timer import Timer
+from textual.widget import Widget
 from textual.command import Command, DiscoveryHit
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Log, Sparkline, Static
 from textual.css.query import NoMatches
 
 from .bus_manager import BusManager, BusManagerError
 from .controllers import (
-    MotorTarget,
     assign_motor_ids,
     command_mit,
     command_velocity,
-    command_velocities,
+    command_velocity_all,
     enable_all,
     disable,
     disable_all,
     enable,
-    read_param_float,
+    read_param_floats,
     refresh_params,
     zero,
 )
 from .dmlib import params, protocol
 from .dmlib.protocol import Feedback
 from .discovery import MotorInfo, active_probe, passive_sniff
-from .demos import DemoHandle, brake_to_zero, sine_orchestra
+from .history import TelemetryHistory
+from . import logging as telemetry_logging
 from .persistence import (
     AppConfig,
     GroupRecord,
@@ -51,10 +54,11 @@ from .persistence import (
     load_config,
     save_config,
 )
-from .osutils import read_bus_statistics
 
 if TYPE_CHECKING:
-    from .logging import TelemetryCsvWriter
+    from .demos import DemoHandle
+
+_W = TypeVar("_W", bound=Widget)
 
 DEFAULT_P_MAX = 12.0
 DEFAULT_V_MAX = 30.0
@@ -64,6 +68,14 @@ DEFAULT_KD_MAX = protocol.MIT_DEFAULT_KD_LIMIT
 
 LIMIT_METADATA_KEYS = ("p_max", "v_max", "t_max")
 
+# Panel bits for DmTuiApp._refresh_panels.
+REFRESH_TABLE = 1
+REFRESH_TELEMETRY = 2
+REFRESH_DETAIL = 4
+REFRESH_GROUPS = 8
+REFRESH_HINT = 16
+REFRESH_CONTROL = 32
+
 
 def _parse_env_float(name: str, default: float) -> float:
     """Return a float from *name* env var, falling back to *default* on errors."""
@@ -82,18 +94,46 @@ def _has_limit_metadata(metadata: Mapping[str, object]) -> bool:
 
 
 def _coerce_positive(value: object, default: float) -> float:
-    try:
-        candidate = float(value)
-    except (TypeError, ValueError):
+    # Runs for every feedback frame via _resolve_limits; metadata limits are almost
+    # always numbers already, so only fall back to parsing for anything else.
+    if value is None:
         return default
+    if isinstance(value, (float, int)):
+        candidate = float(value)
+    else:
+        try:
+            candidate = float(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return default
     if not math.isfinite(candidate) or candidate <= 0:
         return default
     return candidate
 
 
-WATCHDOG_THRESHOLD_SECONDS = _parse_env_float("DM_TUI_WATCHDOG_THRESHOLD", 3.0)
-WATCHDOG_COOLDOWN_SECONDS = _parse_env_float("DM_TUI_WATCHDOG_COOLDOWN", 5.0)
-WATCHDOG_INTERVAL_SECONDS = _parse_env_float("DM_TUI_WATCHDOG_INTERVAL", 1.0)
+@dataclass(frozen=True, slots=True)
+class _Tunables:
+    """Process-wide timing knobs, resolved from the environment once at import."""
+
+    watchdog_threshold: float
+    watchdog_cooldown: float
+    watchdog_interval: float
+    # Feedback can arrive at kHz rates; telemetry-driven panels redraw at most this often.
+    ui_refresh_interval: float = 1 / 30
+    # Raw frames buffered between the bus notifier thread and the UI tick (oldest dropped first).
+    rx_queue_limit: int = 4096
+    # Trailing delay before a bus switch reopens the interface.
+    bus_switch_delay: float = 0.05
+    # Telemetry CSV rows waiting for the log writer thread (newest dropped when full).
+    log_queue_limit: int = 4096
+    # Motors discovered within this window are written to the config file in one save.
+    config_save_delay: float = 1.0
+
+
+TUNABLES = _Tunables(
+    watchdog_threshold=_parse_env_float("DM_TUI_WATCHDOG_THRESHOLD", 3.0),
+    watchdog_cooldown=_parse_env_float("DM_TUI_WATCHDOG_COOLDOWN", 5.0),
+    watchdog_interval=_parse_env_float("DM_TUI_WATCHDOG_INTERVAL", 1.0),
+)
 
 def _parse_optional_float(value: str) -> float | None:
     value = value.strip()
@@ -105,6 +145,71 @@ def _parse_optional_float(value: str) -> float | None:
         return None
 
 
+def _format_bitrate(bitrate: object) -> str:
+    if not bitrate:
+        return "--"
+    if not isinstance(bitrate, int):
+        return str(bitrate)
+    if bitrate % 1000:
+        return f"{bitrate / 1000:g} kbps"
+    return f"{bitrate // 1000} kbps"
+
+
+# Hex labels for every ESC/MST ID the DM protocol can address, formatted once at import.
+_ESC_HEX = tuple(f"0x{esc_id:02X}" for esc_id in range(0x100))
+_MST_HEX = tuple(f"0x{mst_id:03X}" for mst_id in range(0x800))
+
+
+def _esc_hex(esc_id: int) -> str:
+    if 0 <= esc_id < 0x100:
+        return _ESC_HEX[esc_id]
+    return f"0x{esc_id:02X}"
+
+
+def _mst_hex(mst_id: int) -> str:
+    if 0 <= mst_id < 0x800:
+        return _MST_HEX[mst_id]
+    return f"0x{mst_id:03X}"
+
+
+_ESC_TOKEN_RE = re.compile(r"0[xX]([0-9a-fA-F]+)|([0-9]+)")
+
+
+def _parse_id_token(tok: str) -> int | None:
+    """Parse one ``0x``-prefixed hex or decimal ID, or return ``None`` if *tok* is neither."""
+
+    match = _ESC_TOKEN_RE.fullmatch(tok)
+    if match is None:
+        return None
+    hex_digits, dec_digits = match.groups()
+    return int(hex_digits, 16) if hex_digits is not None else int(dec_digits)
+
+
+def _parse_esc_ids(text: str) -> tuple[list[int], str | None]:
+    """Parse comma/space separated ESC IDs (``0x``-prefixed hex or decimal).
+
+    Returns the IDs read so far and the first token that is not a valid ID, if any.
+    """
+
+    esc_ids: list[int] = []
+    for tok in text.replace(",", " ").split():
+        esc_id = _parse_id_token(tok)
+        if esc_id is None:
+            return esc_ids, tok
+        esc_ids.append(esc_id)
+    return esc_ids, None
+
+
+def _describe_reload(previous: Iterable[int], current: Iterable[int]) -> str:
+    before = frozenset(previous)
+    after = frozenset(current)
+    changes = [f"+{_esc_hex(esc_id)}" for esc_id in sorted(after - before)]
+    changes.extend(f"-{_esc_hex(esc_id)}" for esc_id in sorted(before - after))
+    if not changes:
+        return "Configuration reloaded."
+    return f"Configuration reloaded (motors {' '.join(changes)})."
+
+
 @dataclass(slots=True)
 class TelemetryRecord:
     feedback: Feedback
@@ -188,9 +293,22 @@ DEMO_DEFINITIONS: list[DemoDefinition] = [
         mode="figure8",
     ),
 ]
+DEMO_BY_KEY: dict[str, DemoDefinition] = {demo.key: demo for demo in DEMO_DEFINITIONS}
+
 
+class _TextPanel(Static):
+    """Static panel that skips the repaint when its markup has not changed."""
 
-class BusStatusPanel(Static):
+    _shown_text: str | None = None
+
+    def _show_text(self, text: str) -> None:
+        if text == self._shown_text:
+            return
+        self._shown_text = text
+        self.update(text)
+
+
+class BusStatusPanel(_TextPanel):
     """Panel summarising SocketCAN interface state."""
 
     DEFAULT_CSS = """
@@ -201,7 +319,22 @@ class BusStatusPanel(Static):
     }
     """
 
+    STATS_TEMPLATE = (
+        "[b]Channel[/b]  %s\n"
+        "[b]State[/b]    %s\n"
+        "[b]Bitrate[/b]  %s\n"
+        "[b]TX[/b]       %s (err %s)\n"
+        "[b]RX[/b]       %s (err %s)\n"
+        "[b]Queue[/b]    %s"
+    )
+
+    _shown_stats: tuple[str, Dict[str, object]] | None = None
+
     def update_stats(self, channel: str, stats: Dict[str, object]) -> None:
+        # Stats are polled every few seconds and are usually identical on an idle bus.
+        if (channel, stats) == self._shown_stats:
+            return
+        self._shown_stats = (channel, stats)
         bitrate = stats.get("bitrate")
         oper_state = stats.get("oper_state") or stats.get("state") or "--"
         tx_packets = stats.get("tx_packets", "--")
@@ -209,20 +342,23 @@ class BusStatusPanel(Static):
         rx_packets = stats.get("rx_packets", "--")
         rx_errors = stats.get("rx_errors", "0")
         queue_len = stats.get("tx_queue_len", "--")
-        text = "\n".join(
-            [
-                f"[b]Channel[/b]  {channel}",
-                f"[b]State[/b]    {oper_state}",
-                f"[b]Bitrate[/b]  {bitrate if bitrate else '--'}",
-                f"[b]TX[/b]       {tx_packets} (err {tx_errors})",
-                f"[b]RX[/b]       {rx_packets} (err {rx_errors})",
-                f"[b]Queue[/b]    {queue_len}",
-            ]
+        self._show_text(
+            self.STATS_TEMPLATE
+            % (
+                channel,
+                oper_state,
+                _format_bitrate(bitrate),
+                tx_packets,
+                tx_errors,
+                rx_packets,
+                rx_errors,
+                queue_len,
+            )
         )
-        self.update(text)
 
     def update_error(self, channel: str, message: str) -> None:
-        self.update(f"[b]Channel[/b]  {channel}\n[red]{message}[/red]")
+        self._shown_stats = None
+        self._show_text(f"[b]Channel[/b]  {channel}\n[red]{message}[/red]")
 
 
 class MotorTable(DataTable):
@@ -235,12 +371,17 @@ class MotorTable(DataTable):
     }
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._row_keys: list[str] = []
+        # Rendered cell tuple per ESC, used to skip rows whose content is unchanged.
+        self._row_cache: Dict[int, tuple[str, ...]] = {}
+
     def on_mount(self) -> None:  # noqa: D401
         self.add_columns("ESC", "MST", "Name", "Status", "Last Seen")
         self.cursor_type = "row"
         self.show_cursor = True
         self.zebra_stripes = True
-        self._row_keys: list[str] = []
 
     def update_rows(
         self,
@@ -251,50 +392,94 @@ class MotorTable(DataTable):
         telemetry: Dict[int, "TelemetryRecord"] | None = None,
         watchdog_tripped: set[int] | None = None,
         last_disable: Dict[int, float] | None = None,
-    ) -> None:
-        self.clear()
-        self._row_keys.clear()
-        esc_ids = sorted(set(records.keys()) | set(motors.keys()) | set(telemetry.keys() if telemetry else []))
-        for esc_id in esc_ids:
-            record = records.get(esc_id)
-            info = motors.get(esc_id)
-            telemetry_record = telemetry.get(esc_id) if telemetry else None
-            mst_id = info.mst_id if info else (record.mst_id if record else 0)
-            last_seen_value: float | None = None
-            if info:
-                last_seen_value = info.last_seen
-            if telemetry_record is not None:
-                last_seen_value = (
-                    telemetry_record.timestamp
-                    if last_seen_value is None
-                    else max(last_seen_value, telemetry_record.timestamp)
-                )
-            status = "Configured"
-            delta = None
-            if last_seen_value is not None:
-                delta = max(0.0, now - last_seen_value)
-                last_seen = f"{delta:0.1f}s ago"
-                status = "Active" if delta < 2.0 else "Quiet"
-            else:
-                last_seen = "--"
-            triggered = bool(watchdog_tripped and esc_id in watchdog_tripped)
-            if triggered:
-                status = "[red]Watchdog[/red]"
-                if last_disable and esc_id in last_disable:
-                    since_disable = max(0.0, now - last_disable[esc_id])
-                    status = f"[red]Watchdog[/red] ({since_disable:0.1f}s ago)"
-                last_seen = f"[red]{last_seen}[/red]"
-            name = record.name if record and record.name else "--"
-            row_key = str(esc_id)
-            self.add_row(
-                f"0x{esc_id:02X}",
-                f"0x{mst_id:03X}",
-                name,
-                status,
-                last_seen,
-                key=row_key,
+        esc_ids: Sequence[int] | None = None,
+    ) -> bool:
+        """Render one row per ESC, returning ``True`` when rows were added or removed."""
+
+        if esc_ids is None:
+            esc_ids = sorted(set(records.keys()) | set(motors.keys()) | set(telemetry.keys() if telemetry else []))
+        rows = {
+            esc_id: self._render_cells(
+                esc_id,
+                records.get(esc_id),
+                motors.get(esc_id),
+                telemetry.get(esc_id) if telemetry else None,
+                now,
+                watchdog_tripped,
+                last_disable,
             )
-            self._row_keys.append(row_key)
+            for esc_id in esc_ids
+        }
+        row_keys = [str(esc_id) for esc_id in esc_ids]
+        column_keys = tuple(self.columns)
+        cache = self._row_cache
+        membership_changed = row_keys != self._row_keys
+        if membership_changed:
+            # Drop and add only the affected rows; surviving rows are diffed below.
+            wanted = set(row_keys)
+            order = []
+            for row_key in self._row_keys:
+                if row_key in wanted:
+                    order.append(row_key)
+                else:
+                    self.remove_row(row_key)
+            known = set(order)
+            for row_key, (esc_id, cells) in zip(row_keys, rows.items()):
+                if row_key not in known:
+                    self.add_row(*cells, key=row_key)
+                    order.append(row_key)
+                    cache[esc_id] = cells
+            if order != row_keys:
+                # New IDs landed mid-table: restore ascending ESC order.
+                self.sort(column_keys[0], key=lambda label: int(label, 16))
+            self._row_keys = row_keys
+        for esc_id, cells in rows.items():
+            previous = cache.get(esc_id)
+            if previous == cells:
+                continue
+            row_key = str(esc_id)
+            for index, value in enumerate(cells):
+                if previous is None or previous[index] != value:
+                    self.update_cell(row_key, column_keys[index], value, update_width=True)
+        self._row_cache = rows
+        return membership_changed
+
+    @staticmethod
+    def _render_cells(
+        esc_id: int,
+        record: MotorRecord | None,
+        info: MotorInfo | None,
+        telemetry_record: "TelemetryRecord | None",
+        now: float,
+        watchdog_tripped: set[int] | None,
+        last_disable: Dict[int, float] | None,
+    ) -> tuple[str, ...]:
+        mst_id = info.mst_id if info else (record.mst_id if record else 0)
+        last_seen_value: float | None = None
+        if info:
+            last_seen_value = info.last_seen
+        if telemetry_record is not None:
+            timestamp = telemetry_record.timestamp
+            if last_seen_value is None or timestamp > last_seen_value:
+                last_seen_value = timestamp
+        status = "Configured"
+        if last_seen_value is not None:
+            # Plain comparisons instead of max(): this runs per row on every refresh tick.
+            delta = now - last_seen_value
+            if delta < 0.0:
+                delta = 0.0
+            last_seen = f"{delta:0.1f}s ago"
+            status = "Active" if delta < 2.0 else "Quiet"
+        else:
+            last_seen = "--"
+        if watchdog_tripped and esc_id in watchdog_tripped:
+            status = "[red]Watchdog[/red]"
+            if last_disable and esc_id in last_disable:
+                since_disable = max(0.0, now - last_disable[esc_id])
+                status = f"[red]Watchdog[/red] ({since_disable:0.1f}s ago)"
+            last_seen = f"[red]{last_seen}[/red]"
+        name = record.name if record and record.name else "--"
+        return (_esc_hex(esc_id), _mst_hex(mst_id), name, status, last_seen)
 
     def focus_esc(self, esc_id: int) -> None:
         key = str(esc_id)
@@ -323,7 +508,7 @@ class ActivityLog(Log):
         self.auto_scroll = True
 
 
-class HintPanel(Static):
+class HintPanel(_TextPanel):
     """Key binding hint box."""
 
     DEFAULT_CSS = """
@@ -334,35 +519,40 @@ class HintPanel(Static):
     }
     """
 
+    # Static key-binding help, joined once at import instead of on every update.
+    KEY_HELP = "\n".join(
+        [
+            "[b]Key Bindings[/b]",
+            "Space  E-STOP",
+            "R      Re-scan",
+            "B      Cycle Bus",
+            "E/D/Z Enable/Disable/Zero",
+            "V      Set Velocity",
+            "T      MIT Command",
+            "A      ID Wizard",
+            "M      Edit Metadata",
+            "Ctrl+M Edit Groups",
+            "Ctrl+G Group Actions",
+            "Ctrl+D Launch Demo",
+            "Ctrl+Shift+D Stop Demo",
+            "Ctrl+S Save Config",
+            "Ctrl+R Reload Config",
+            ":      Command Palette",
+        ]
+    )
+    HINT_TEMPLATE = "[b]Active Bus[/b]  %s\n[b]Selected[/b]  %s\n\n" + KEY_HELP
+
     def update_hints(self, bus: str, selected: int | None) -> None:
-        self.update(
-            "\n".join(
-                [
-                    f"[b]Active Bus[/b]  {bus}",
-                    f"[b]Selected[/b]  0x{selected:02X}" if selected is not None else "[b]Selected[/b]  --",
-                    "",
-                    "[b]Key Bindings[/b]",
-                    "Space  E-STOP",
-                    "R      Re-scan",
-                    "B      Cycle Bus",
-                    "E/D/Z Enable/Disable/Zero",
-                    "V      Set Velocity",
-                    "T      MIT Command",
-                    "A      ID Wizard",
-                    "M      Edit Metadata",
-                    "Ctrl+M Edit Groups",
-                    "Ctrl+G Group Actions",
-                    "Ctrl+D Launch Demo",
-                    "Ctrl+Shift+D Stop Demo",
-                    "Ctrl+S Save Config",
-                    ":      Command Palette",
-                ]
-            )
-        )
+        selected_text = _esc_hex(selected) if selected is not None else "--"
+        self._show_text(self.HINT_TEMPLATE % (bus, selected_text))
 
 
-class MotorControlPanel(Static):
-    """Button panel exposing per-motor controls."""
+class MotorControlPanel(Widget):
+    """Button panel exposing per-motor controls.
+
+    A plain container: Textual paints the background with its ``Blank`` visual
+    instead of rendering an empty ``Static`` body underneath the children.
+    """
 
     DEFAULT_CSS = """
     MotorControlPanel {
@@ -381,26 +571,25 @@ class MotorControlPanel(Static):
     }
     """
 
+    IDLE_TEXT = "Select a motor to enable controls."
+    # (button id, label, app action) shared by every panel instance.
+    BUTTON_SPECS = (
+        ("control-enable", "Enable", "action_enable_selected"),
+        ("control-disable", "Disable", "action_disable_selected"),
+        ("control-zero", "Zero", "action_zero_selected"),
+        ("control-velocity", "Velocity…", "action_set_velocity"),
+        ("control-mit", "MIT…", "action_set_mit"),
+    )
+    _action_lookup = {button_id: action for button_id, _label, action in BUTTON_SPECS}
+
     def __init__(self, *children, **kwargs) -> None:
         super().__init__(*children, **kwargs)
-        self._info = Static("Select a motor to enable controls.", id="motor-control-info")
-        specs = [
-            ("control-enable", "Enable", "action_enable_selected"),
-            ("control-disable", "Disable", "action_disable_selected"),
-            ("control-zero", "Zero", "action_zero_selected"),
-            ("control-velocity", "Velocity…", "action_set_velocity"),
-            ("control-mit", "MIT…", "action_set_mit"),
-        ]
-        buttons = []
-        self._buttons: dict[str, Button] = {}
-        self._action_lookup: dict[str, str] = {}
-        for button_id, label, action in specs:
-            button = Button(label, id=button_id)
-            button.disabled = True
-            self._buttons[button_id] = button
-            self._action_lookup[button_id] = action
-            buttons.append(button)
-        self._buttons_row = Horizontal(*buttons, id="motor-control-buttons")
+        self._info = Static(self.IDLE_TEXT, id="motor-control-info")
+        self._buttons: dict[str, Button] = {
+            button_id: Button(label, id=button_id, disabled=True)
+            for button_id, label, _action in self.BUTTON_SPECS
+        }
+        self._buttons_row = Horizontal(*self._buttons.values(), id="motor-control-buttons")
         self._current_esc: int | None = None
 
     def compose(self) -> ComposeResult:
@@ -410,10 +599,10 @@ class MotorControlPanel(Static):
     def update_controls(self, esc_id: int | None, *, bus_online: bool) -> None:
         self._current_esc = esc_id
         if esc_id is None:
-            self._info.update("Select a motor to enable controls.")
+            self._info.update(self.IDLE_TEXT)
         else:
             status = "online" if bus_online else "offline"
-            self._info.update(f"ESC 0x{esc_id:02X} ({status})")
+            self._info.update(f"ESC {_esc_hex(esc_id)} ({status})")
         disabled = esc_id is None or not bus_online
         for button in self._buttons.values():
             try:
@@ -434,6 +623,10 @@ class MotorControlPanel(Static):
         handler = getattr(app, action, None)
         if handler is None:
             return
+        # Button presses arrive on the UI thread; call straight through in that case.
+        if getattr(app, "_thread_id", None) == threading.get_ident():
+            handler()
+            return
         caller = getattr(app, "call_from_thread", None)
         if callable(caller):
             try:
@@ -444,7 +637,7 @@ class MotorControlPanel(Static):
         handler()
 
 
-class MotorDetailPanel(Static):
+class MotorDetailPanel(_TextPanel):
     """Detailed view for the currently highlighted motor."""
 
     DEFAULT_CSS = """
@@ -455,8 +648,23 @@ class MotorDetailPanel(Static):
     }
     """
 
+    IDLE_TEXT = "Select a motor row to view details."
+    HEADER_TEMPLATE = (
+        "[b]ESC[/b] %s | [b]MST[/b] %s\n"
+        "[b]Name[/b] %s\n"
+        "[b]Group[/b] %s\n"
+        "[b]Last Seen[/b] %s\n"
+    )
+    TELEMETRY_TEMPLATE = (
+        HEADER_TEMPLATE + "[b]Temps[/b] MOS %d°C | Rotor %d°C\n"
+        "[b]Velocity[/b] %.2f rad/s\n"
+        "[b]Torque[/b] %.2f Nm\n"
+        "[b]Telemetry[/b] %s (%.1fs old)"
+    )
+    NO_TELEMETRY_TEMPLATE = HEADER_TEMPLATE + "[b]Temps[/b] --\n[b]Velocity[/b] --\n[b]Torque[/b] --"
+
     def show_idle(self) -> None:
-        self.update("Select a motor row to view details.")
+        self._show_text(self.IDLE_TEXT)
 
     def show_details(
         self,
@@ -469,45 +677,40 @@ class MotorDetailPanel(Static):
         watchdog_active: bool = False,
         watchdog_last: float | None = None,
     ) -> None:
-        if telemetry:
-            delta = now - telemetry.timestamp
-            temps = f"MOS {telemetry.feedback.temp_mos}°C | Rotor {telemetry.feedback.temp_rotor}°C"
-            velocity = f"{telemetry.velocity_rad_s:0.2f} rad/s"
-            torque = f"{telemetry.torque_nm:0.2f} Nm"
-        else:
-            delta = None
-            temps = "--"
-            velocity = "--"
-            torque = "--"
         mst_id = info.mst_id if info else (record.mst_id if record else 0)
         last_seen = "--"
         if info:
-            last_seen = f"{max(0.0, now - info.last_seen):0.1f}s ago"
+            last_seen = "%.1fs ago" % max(0.0, now - info.last_seen)
         name = record.name if record and record.name else "--"
         group = record.group if record and record.group else "--"
-        lines = [
-            f"[b]ESC[/b] 0x{esc_id:02X} | [b]MST[/b] 0x{mst_id:03X}",
-            f"[b]Name[/b] {name}",
-            f"[b]Group[/b] {group}",
-            f"[b]Last Seen[/b] {last_seen}",
-            f"[b]Temps[/b] {temps}",
-            f"[b]Velocity[/b] {velocity}",
-            f"[b]Torque[/b] {torque}",
-        ]
-        if delta is not None:
-            status = "Fresh" if delta < 1.0 else "Stale"
-            lines.append(f"[b]Telemetry[/b] {status} ({delta:0.1f}s old)")
+        # One %-format over a class-level template per refresh instead of an f-string per line.
+        if telemetry:
+            feedback = telemetry.feedback
+            delta = now - telemetry.timestamp
+            text = self.TELEMETRY_TEMPLATE % (
+                _esc_hex(esc_id),
+                _mst_hex(mst_id),
+                name,
+                group,
+                last_seen,
+                feedback.temp_mos,
+                feedback.temp_rotor,
+                telemetry.velocity_rad_s,
+                telemetry.torque_nm,
+                "Fresh" if delta < 1.0 else "Stale",
+                delta,
+            )
+        else:
+            text = self.NO_TELEMETRY_TEMPLATE % (_esc_hex(esc_id), _mst_hex(mst_id), name, group, last_seen)
         if watchdog_active:
             if watchdog_last is not None:
-                lines.append(
-                    f"[red]Watchdog auto-disable[/red] {max(0.0, now - watchdog_last):0.1f}s ago."
-                )
+                text += "\n[red]Watchdog auto-disable[/red] %.1fs ago." % max(0.0, now - watchdog_last)
             else:
-                lines.append("[red]Watchdog auto-disable active.[/red]")
-        self.update("\n".join(lines))
+                text += "\n[red]Watchdog auto-disable active.[/red]"
+        self._show_text(text)
 
 
-class TelemetryPanel(Static):
+class TelemetryPanel(_TextPanel):
     """Compact overview showing recent telemetry across motors."""
 
     DEFAULT_CSS = """
@@ -518,29 +721,43 @@ class TelemetryPanel(Static):
     }
     """
 
-    def update_rows(self, telemetry: Dict[int, TelemetryRecord], now: float) -> None:
+    IDLE_TEXT = "Telemetry will appear once feedback frames arrive."
+    MAX_ROWS = 6
+    ROW_TEMPLATE = "%s  θ=%.2f rad  ω=%.2f rad/s  τ=%.2f Nm  age=%.1fs"
+
+    def update_rows(
+        self,
+        telemetry: Dict[int, TelemetryRecord],
+        now: float,
+        *,
+        esc_ids: Sequence[int] | None = None,
+    ) -> None:
+        """Show *esc_ids* (default: the lowest ``MAX_ROWS`` IDs in *telemetry*)."""
+
         if not telemetry:
-            self.update("Telemetry will appear once feedback frames arrive.")
+            self._show_text(self.IDLE_TEXT)
             return
+        if esc_ids is None:
+            # Only the lowest few IDs fit; a bounded heap avoids sorting every key.
+            esc_ids = heapq.nsmallest(self.MAX_ROWS, telemetry)
         lines = ["[b]Live Telemetry[/b]"]
-        for esc_id in sorted(telemetry)[:6]:
+        template = self.ROW_TEMPLATE
+        for esc_id in esc_ids:
             record = telemetry[esc_id]
-            age = now - record.timestamp
             lines.append(
-                "  ".join(
-                    [
-                        f"0x{esc_id:02X}",
-                        f"θ={record.position_rad:0.2f} rad",
-                        f"ω={record.velocity_rad_s:0.2f} rad/s",
-                        f"τ={record.torque_nm:0.2f} Nm",
-                        f"age={age:0.1f}s",
-                    ]
+                template
+                % (
+                    _esc_hex(esc_id),
+                    record.position_rad,
+                    record.velocity_rad_s,
+                    record.torque_nm,
+                    now - record.timestamp,
                 )
             )
-        self.update("\n".join(lines))
+        self._show_text("\n".join(lines))
 
 
-class GroupPanel(Static):
+class GroupPanel(_TextPanel):
     """Display configured motor groups."""
 
     DEFAULT_CSS = """
@@ -551,20 +768,22 @@ class GroupPanel(Static):
     }
     """
 
+    IDLE_TEXT = "No groups configured. Press M to tag motors or Ctrl+G to define one."
+
     def update_groups(self, groups: Dict[str, GroupRecord]) -> None:
         if not groups:
-            self.update("No groups configured. Press M to tag motors or Ctrl+G to define one.")
+            self._show_text(self.IDLE_TEXT)
             return
         lines = ["[b]Groups[/b]"]
         for name, record in sorted(groups.items()):
-            escs = ", ".join(f"0x{esc:02X}" for esc in sorted(record.esc_ids)) or "(empty)"
+            escs = ", ".join(_esc_hex(esc) for esc in sorted(record.esc_ids)) or "(empty)"
             lines.append(f"{name}: {escs}")
         lines.append("")
         lines.append("Ctrl+G to run actions · Ctrl+D to launch demos")
-        self.update("\n".join(lines))
+        self._show_text("\n".join(lines))
 
 
-class VelocitySparkline(Static):
+class VelocitySparkline(Widget):
     """Sparkline showing recent velocity history for the selected motor."""
 
     DEFAULT_CSS = """
@@ -583,22 +802,47 @@ class VelocitySparkline(Static):
     def __init__(self, *, id: str | None = None) -> None:
         super().__init__(id=id)
         self._spark = Sparkline(id="velocity-sparkline")
-        self._caption = Label("Select a motor to view velocity history.", id="velocity-caption")
+        self._caption_text = "Select a motor to view velocity history."
+        self._caption = Label(self._caption_text, id="velocity-caption")
+        self._shown: tuple[int | None, TelemetryHistory | None, int] | None = None
 
     def compose(self) -> ComposeResult:
         yield Label("Velocity History", id="velocity-title")
         yield self._spark
         yield self._caption
 
+    def show_history(self, esc_id: Optional[int], history: TelemetryHistory | None) -> None:
+        """Render *history*, skipping the copy when no samples arrived since the last call."""
+
+        shown = (esc_id, history, history.total if history is not None else 0)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        self.update_series(esc_id, history.velocities() if history is not None else [])
+
     def update_series(self, esc_id: Optional[int], values: Iterable[float]) -> None:
-        series = list(values)
+        series = values if isinstance(values, list) else list(values)
         self._spark.data = series if series else None
         if esc_id is None:
-            self._caption.update("Select a motor to view velocity history.")
+            caption = "Select a motor to view velocity history."
         elif not series:
-            self._caption.update(f"ESC 0x{esc_id:02X}: no velocity samples yet.")
+            caption = f"ESC {_esc_hex(esc_id)}: no velocity samples yet."
         else:
-            self._caption.update(f"ESC 0x{esc_id:02X}: last {len(series)} samples")
+            caption = f"ESC {_esc_hex(esc_id)}: last {len(series)} samples"
+        # Once the ring is full the caption stops changing; skip the redundant label refresh.
+        if caption != self._caption_text:
+            self._caption_text = caption
+            self._caption.update(caption)
+
+
+class PanelColumn(Vertical):
+    """Column of dashboard panels that reports when it is laid out at a new size."""
+
+    class Resized(Message):
+        """Posted once the column's new region is known."""
+
+    def on_resize(self, event: Resize) -> None:
+        self.post_message(self.Resized())
 
 
 class VelocityModal(ModalScreen[Optional[float]]):
@@ -610,9 +854,10 @@ class VelocityModal(ModalScreen[Optional[float]]):
         self._default = default
         self._error: Label | None = None
         self._input: Input | None = None
+        self._apply_button: Button | None = None
 
     def compose(self) -> ComposeResult:
-        yield Static(f"Set velocity for ESC 0x{self._esc_id:02X}", id="vel-title")
+        yield Static(f"Set velocity for ESC {_esc_hex(self._esc_id)}", id="vel-title")
         default_text = "" if self._default is None else f"{self._default:0.2f}"
         self._input = Input(default_text, placeholder="rad/s", id="vel-input")
         yield self._input
@@ -620,7 +865,8 @@ class VelocityModal(ModalScreen[Optional[float]]):
         yield self._error
         with Horizontal(id="vel-buttons"):
             yield Button("Cancel", id="cancel")
-            yield Button("Apply", id="apply", variant="primary")
+            self._apply_button = Button("Apply", id="apply", variant="primary")
+            yield self._apply_button
 
     def on_mount(self, event: Mount) -> None:  # noqa: D401
         if self._input:
@@ -642,8 +888,8 @@ class VelocityModal(ModalScreen[Optional[float]]):
         self.dismiss(value)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        apply_button = self.query_one("#apply", Button)
-        self.on_button_pressed(Button.Pressed(apply_button))
+        if self._apply_button is not None:
+            self.on_button_pressed(Button.Pressed(self._apply_button))
 
 
 class MitModal(ModalScreen[Optional[MitCommand]]):
@@ -674,9 +920,10 @@ class MitModal(ModalScreen[Optional[MitCommand]]):
         self._torque_input: Input | None = None
         self._kp_input: Input | None = None
         self._kd_input: Input | None = None
+        self._apply_button: Button | None = None
 
     def compose(self) -> ComposeResult:
-        yield Static(f"MIT command for ESC 0x{self._esc_id:02X}", id="mit-title")
+        yield Static(f"MIT command for ESC {_esc_hex(self._esc_id)}", id="mit-title")
         self._position_input = Input(
             self._format_default(self._defaults.position_rad),
             placeholder=f"Position ±{self._position_limit:0.2f} rad",
@@ -711,7 +958,8 @@ class MitModal(ModalScreen[Optional[MitCommand]]):
         yield self._error
         with Horizontal(id="mit-buttons"):
             yield Button("Cancel", id="cancel")
-            yield Button("Apply", id="apply", variant="primary")
+            self._apply_button = Button("Apply", id="apply", variant="primary")
+            yield self._apply_button
 
     def _format_default(self, value: float) -> str:
         return "" if abs(value) < 1e-9 else f"{value:0.3f}"
@@ -724,53 +972,36 @@ class MitModal(ModalScreen[Optional[MitCommand]]):
         if event.button.id == "cancel":
             self.dismiss(None)
             return
-        try:
-            command = MitCommand(
-                position_rad=self._parse_value(
-                    self._position_input,
-                    name="Position",
-                    minimum=-self._position_limit,
-                    maximum=self._position_limit,
-                    default=self._defaults.position_rad,
-                ),
-                velocity_rad_s=self._parse_value(
-                    self._velocity_input,
-                    name="Velocity",
-                    minimum=-self._velocity_limit,
-                    maximum=self._velocity_limit,
-                    default=self._defaults.velocity_rad_s,
-                ),
-                torque_nm=self._parse_value(
-                    self._torque_input,
-                    name="Torque",
-                    minimum=-self._torque_limit,
-                    maximum=self._torque_limit,
-                    default=self._defaults.torque_nm,
-                ),
-                kp=self._parse_value(
-                    self._kp_input,
-                    name="Kp",
-                    minimum=0.0,
-                    maximum=self._kp_limit,
-                    default=self._defaults.kp,
-                ),
-                kd=self._parse_value(
-                    self._kd_input,
-                    name="Kd",
-                    minimum=0.0,
-                    maximum=self._kd_limit,
-                    default=self._defaults.kd,
-                ),
-            )
-        except ValueError as exc:
+        fields = (
+            ("position_rad", self._position_input, "Position", -self._position_limit, self._position_limit),
+            ("velocity_rad_s", self._velocity_input, "Velocity", -self._velocity_limit, self._velocity_limit),
+            ("torque_nm", self._torque_input, "Torque", -self._torque_limit, self._torque_limit),
+            ("kp", self._kp_input, "Kp", 0.0, self._kp_limit),
+            ("kd", self._kd_input, "Kd", 0.0, self._kd_limit),
+        )
+        # Parse every field in one pass so all problems are reported together.
+        values: Dict[str, float] = {}
+        errors: list[str] = []
+        for attr, widget, name, minimum, maximum in fields:
+            try:
+                values[attr] = self._parse_value(
+                    widget,
+                    name=name,
+                    minimum=minimum,
+                    maximum=maximum,
+                    default=getattr(self._defaults, attr),
+                )
+            except ValueError as exc:
+                errors.append(str(exc))
+        if errors:
             if self._error:
-                self._error.update(str(exc))
+                self._error.update("\n".join(errors))
             return
-        self.dismiss(command)
+        self.dismiss(MitCommand(**values))
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        apply_button = self.query_one("#apply", Button)
-        self.on_button_pressed(Button.Pressed(apply_button))
+        if self._apply_button is not None:
+            self.on_button_pressed(Button.Pressed(self._apply_button))
 
     def _parse_value(
         self,
@@ -788,7 +1019,7 @@ class MitModal(ModalScreen[Optional[MitCommand]]):
             return default
         try:
             value = float(text)
-        except ValueError as exc:  # pragma: no cover - defensive
+        except ValueError as exc:
             raise ValueError(f"Enter a numeric {name} value.") from exc
         if value < minimum or value > maximum:
             raise ValueError(
@@ -875,13 +1106,10 @@ class IdWizardModal(ModalScreen[Optional[IdAssignmentResult]]):
             if self._error:
                 self._error.update(f"{label} is required.")
             return None
-        try:
-            base = 16 if raw.lower().startswith("0x") else 10
-            return int(raw, base)
-        except ValueError:
-            if self._error:
-                self._error.update(f"{label} must be numeric.")
-            return None
+        value = _parse_id_token(raw)
+        if value is None and self._error:
+            self._error.update(f"{label} must be numeric.")
+        return value
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
@@ -913,7 +1141,7 @@ class MetadataModal(ModalScreen[Optional[MetadataUpdate]]):
         self._t_input = Input(str(metadata.get("t_max", "")), placeholder="T_MAX (Nm)")
 
     def compose(self) -> ComposeResult:
-        yield Static(f"Metadata for ESC 0x{self._esc_id:02X}", id="meta-title")
+        yield Static(f"Metadata for ESC {_esc_hex(self._esc_id)}", id="meta-title")
         yield Label("Name")
         yield self._name_input
         yield Label("Group")
@@ -949,7 +1177,7 @@ class GroupModal(ModalScreen[Optional[GroupDefinition]]):
         super().__init__()
         default_name = next(iter(existing.keys()), "demo")
         self._name_input = Input(default_name, placeholder="Group name")
-        default_escs = " ".join(f"0x{esc:02X}" for esc in existing.get(default_name, GroupRecord(default_name, [])).esc_ids)
+        default_escs = " ".join(_esc_hex(esc) for esc in existing.get(default_name, GroupRecord(default_name, [])).esc_ids)
         self._esc_input = Input(default_escs, placeholder="ESC IDs (comma/space, allow 0x)")
         self._error = Label("")
 
@@ -972,16 +1200,10 @@ class GroupModal(ModalScreen[Optional[GroupDefinition]]):
         if not name:
             self._error.update("[red]Name required.[/red]")
             return
-        esc_field = self._esc_input.value.replace(",", " ")
-        esc_tokens = [tok for tok in esc_field.split() if tok]
-        esc_ids: list[int] = []
-        for tok in esc_tokens:
-            try:
-                base = 16 if tok.lower().startswith("0x") else 10
-                esc_ids.append(int(tok, base))
-            except ValueError:
-                self._error.update(f"[red]Invalid ESC ID token: {tok}[/red]")
-                return
+        esc_ids, invalid = _parse_esc_ids(self._esc_input.value)
+        if invalid is not None:
+            self._error.update(f"[red]Invalid ESC ID token: {invalid}[/red]")
+            return
         self.dismiss(GroupDefinition(name=name, esc_ids=esc_ids))
 
 
@@ -1025,7 +1247,7 @@ class DemoModal(ModalScreen[Optional[tuple[str, str]]]):
 
     def __init__(self, demos: Iterable[DemoDefinition], groups: Dict[str, GroupRecord]) -> None:
         super().__init__()
-        self._demos = {demo.key: demo for demo in demos}
+        self._demos = DEMO_BY_KEY if demos is DEMO_DEFINITIONS else {demo.key: demo for demo in demos}
         self._groups = groups
         default_group = next(iter(groups.keys()), "ALL")
         self._demo_input = Input(next(iter(self._demos.keys()), "sine"), placeholder="Demo key (sine/handshake/figure8)")
@@ -1060,7 +1282,16 @@ class DemoModal(ModalScreen[Optional[tuple[str, str]]]):
 
 
 class DmTuiApp(App[None]):
-    """dm-tui Textual application shell."""
+    """dm-tui Textual application shell.
+
+    Motor, telemetry, group and config state is only mutated on the UI thread.
+    The bus notifier and worker threads hand results over through ``_rx_frames``
+    or ``call_from_thread``. The exceptions are scalar flags a worker sets for
+    itself (``_discovery_running``, ``_last_probe_warning``). Locks serialise
+    background jobs rather than guarding that state: ``_discovery_lock`` and
+    ``_bus_stats_lock`` skip a run while one is active, ``_limits_lock`` queues
+    limit fetches, and ``BusManager`` holds its own send lock across threads.
+    """
 
     CSS = """
     #content {
@@ -1098,84 +1329,141 @@ class DmTuiApp(App[None]):
         Binding("ctrl+shift+d", "stop_demo", "Stop Demo", show=True),
         Binding(":", "open_command_palette", "Command Palette", show=False),
         Binding("ctrl+s", "save_config", "Save config", show=False),
+        Binding("ctrl+r", "reload_config", "Reload config", show=False),
         Binding("ctrl+c", "quit", "Quit", show=False),
     ]
 
+    # MitCommand field order: position, velocity, torque, kp, kd.
+    MIT_FIELD_LABELS = ("position", "velocity", "torque", "kp", "kd")
+    MIT_FIELD_SIGNED = (True, True, True, False, False)
+
     active_bus = reactive("canB")
     selected_esc = reactive(None)
 
     def __init__(self, config_path: Path | None = None) -> None:
         super().__init__()
         self._config_path = config_path
-        self._threads_lock = threading.Lock()
+        # Held for the lifetime of each background worker so a tick that fires while one
+        # is still running skips instead of starting a second (acquired non-blocking).
+        self._discovery_lock = threading.Lock()
+        self._bus_stats_lock = threading.Lock()
         self._mounted = False
-        self._config: AppConfig = load_config(config_path)
-        ensure_bus(self._config, self._config.active_bus, make_active=True)
-        self._motor_records: Dict[int, MotorRecord] = {
-            record.esc_id: record for record in self._config.motors
-        }
+        self._apply_config(load_config(config_path))
         self._motors: Dict[int, MotorInfo] = {}
         self._telemetry: Dict[int, TelemetryRecord] = {}
-        self._telemetry_history: Dict[int, Deque[float]] = {}
-        self._torque_history: Dict[int, Deque[float]] = {}
-        self._temp_history: Dict[int, Deque[int]] = {}
+        # ESC IDs shown by the telemetry panel; None when _telemetry gained or lost a key.
+        self._telemetry_rows: tuple[int, ...] | None = None
+        # Sorted union of ESC IDs across records/motors/telemetry, rebuilt when marked dirty.
+        self._known_esc_ids: list[int] = []
+        self._telemetry_history: Dict[int, TelemetryHistory] = {}
         config_dir = config_path.expanduser().parent if config_path is not None else DEFAULT_CONFIG_DIR
         self._telemetry_log_path = config_dir / "telemetry.csv"
-        self._telemetry_log_writer: "TelemetryCsvWriter | None" = None
+        self._telemetry_log_writer: "telemetry_logging.QueuedCsvWriter | None" = None
         self._telemetry_log_error = False
-        self._groups: Dict[str, GroupRecord] = {
-            group.name: GroupRecord(name=group.name, esc_ids=list(group.esc_ids))
-            for group in self._config.groups
-        }
         self._bus_manager: BusManager | None = None
         self._bus_stats_timer: Timer | None = None
         self._discovery_timer: Timer | None = None
         self._watchdog_timer: Timer | None = None
+        self._ui_refresh_timer: Timer | None = None
+        self._bus_switch_timer: Timer | None = None
+        # Pending debounced config save scheduled by _schedule_persist.
+        self._persist_timer: Timer | None = None
+        # ESC the motor table cursor was last placed on by _refresh_motor_table.
+        self._table_focus: int | None = None
+        # Panels on the main screen, resolved once by _widget.
+        self._widgets: Dict[type[Widget], Widget] = {}
+        # Activity log lines waiting for _flush_log.
+        self._log_pending: list[str] = []
+        # Messages queued by worker threads via _log_from_thread, drained on the UI thread.
+        self._log_inbox: deque[str] = deque(maxlen=1000)
+        self._log_inbox_scheduled = False
+        # REFRESH_* bits still to be redrawn by the next UI refresh tick.
+        self._ui_dirty = 0
+        # REFRESH_* bits of panels clipped out of their column by a small terminal, and
+        # those whose refresh was skipped because of it (redrawn once they are visible).
+        self._offscreen_panels = 0
+        self._skipped_panels = 0
+        # Set while the UI refresh timer is paused for lack of traffic; the notifier
+        # thread clears it and resumes the timer when the next frame arrives.
+        self._ui_refresh_idle = False
+        # (payload, arbitration id, receive time) appended by the notifier thread.
+        self._rx_frames: deque[tuple[bytes, int, float]] = deque(maxlen=TUNABLES.rx_queue_limit)
         self._active_demo: ActiveDemo | None = None
         self._discovery_running = False
-        self._bus_stats_running = False
-        self._watchdog_threshold = WATCHDOG_THRESHOLD_SECONDS
-        self._watchdog_cooldown = max(WATCHDOG_COOLDOWN_SECONDS, self._watchdog_threshold)
-        self._watchdog_interval = max(WATCHDOG_INTERVAL_SECONDS, 0.2)
+        # (bus manager, MST IDs, catch-all) last passed to set_filters.
+        self._filter_signature: tuple[object, frozenset[int], bool] | None = None
+        self._watchdog_threshold = TUNABLES.watchdog_threshold
+        self._watchdog_cooldown = max(TUNABLES.watchdog_cooldown, self._watchdog_threshold)
+        self._watchdog_interval = max(TUNABLES.watchdog_interval, 0.2)
         self._watchdog_last_disable: Dict[int, float] = {}
         self._watchdog_tripped: set[int] = set()
+        # Min-heap of (last_seen, esc_id) holding one live entry per motor; the entry
+        # for each ESC is the one whose timestamp matches _watchdog_scheduled.
+        self._watchdog_heap: list[tuple[float, int]] = []
+        self._watchdog_scheduled: Dict[int, float] = {}
+        self._limit_errors: set[int] = set()
+        # ESCs with a limit RID fetch running on a worker thread.
+        self._limits_inflight: set[int] = set()
+        self._limits_lock = threading.Lock()
+        self._warned_esc_zero = False
+        self._last_probe_warning = 0.0
+        self.active_bus = self._config.active_bus
+
+    def _apply_config(self, config: AppConfig) -> None:
+        """Adopt *config* and rebuild the state derived from it."""
+
+        self._config: AppConfig = config
+        self._esc_ids_dirty = True
+        ensure_bus(self._config, self._config.active_bus, make_active=True)
+        # Bus list is fixed until the next config load; cached for bus cycling.
+        self._bus_channels: tuple[str, ...] = tuple(bus.channel for bus in self._config.buses)
+        self._bus_index: Dict[str, int] = {
+            channel: index for index, channel in enumerate(self._bus_channels)
+        }
+        self._motor_records: Dict[int, MotorRecord] = {
+            record.esc_id: record for record in self._config.motors
+        }
+        # Like motor records, groups are adopted as-is: load_config hands out fresh objects
+        # and _persist_config rebuilds config.groups, so no defensive copy is needed.
+        self._groups: Dict[str, GroupRecord] = {group.name: group for group in self._config.groups}
         self._limits_loaded: set[int] = {
             esc_id
             for esc_id, record in self._motor_records.items()
             if _has_limit_metadata(record.metadata)
         }
-        self._limit_errors: set[int] = set()
-        self._warned_esc_zero = False
-        self._last_probe_warning = 0.0
-        self.active_bus = self._config.active_bus
 
     def compose(self) -> ComposeResult:
         yield Header()
         with Horizontal(id="content"):
-            with Vertical(id="left-column"):
+            with PanelColumn(id="left-column"):
                 yield BusStatusPanel(id="bus-status")
                 yield MotorTable(id="motor-table")
-                yield TelemetryPanel(id="telemetry-panel")
+                yield TelemetryPanel(TelemetryPanel.IDLE_TEXT, id="telemetry-panel")
                 yield VelocitySparkline(id="velocity-history")
-            with Vertical(id="right-column"):
-                yield MotorDetailPanel(id="motor-detail")
+            with PanelColumn(id="right-column"):
+                yield MotorDetailPanel(MotorDetailPanel.IDLE_TEXT, id="motor-detail")
                 yield MotorControlPanel(id="motor-control")
-                yield GroupPanel(id="group-panel")
+                yield GroupPanel(GroupPanel.IDLE_TEXT, id="group-panel")
                 yield ActivityLog(id="activity-log")
                 yield HintPanel(id="hint-panel")
         yield Footer()
 
     def on_mount(self) -> None:
         self._mounted = True
-        self._refresh_hint_panel()
-        self._refresh_motor_table()
-        self._refresh_detail_panel()
-        self._refresh_group_panel()
-        self._refresh_control_panel()
+        # Panels are composed with their idle text, so only refresh those with real content.
+        panels = REFRESH_HINT | REFRESH_CONTROL
+        if self._motor_records or self._motors:
+            panels |= REFRESH_TABLE
+        if self.selected_esc is not None:
+            panels |= REFRESH_DETAIL
+        if self._groups:
+            panels |= REFRESH_GROUPS
+        self._refresh_panels(panels)
         self._open_bus(self.active_bus)
         self._bus_stats_timer = self.set_interval(3.0, self._schedule_bus_stats_refresh)
         self._discovery_timer = self.set_interval(4.0, self._schedule_discovery)
         self._watchdog_timer = self.set_interval(self._watchdog_interval, self._watchdog_check)
+        self._ui_refresh_timer = self.set_interval(TUNABLES.ui_refresh_interval, self._flush_telemetry_refresh)
 
     def on_unmount(self) -> None:
         if self._bus_stats_timer:
@@ -1184,32 +1472,73 @@ class DmTuiApp(App[None]):
             self._discovery_timer.stop()
         if self._watchdog_timer:
             self._watchdog_timer.stop()
+        if self._ui_refresh_timer:
+            self._ui_refresh_timer.stop()
+        if self._bus_switch_timer:
+            self._bus_switch_timer.stop()
+        if self._persist_timer is not None:
+            self._persist_config()
         self._stop_demo(disable=False)
         self._close_bus()
         self._close_telemetry_log()
+        self._widgets.clear()
         self._mounted = False
 
+    def on_panel_column_resized(self, message: PanelColumn.Resized) -> None:
+        self._update_panel_visibility()
+
+    def _update_panel_visibility(self) -> None:
+        """Recompute which optional panels fall outside their column and catch up on revealed ones."""
+
+        offscreen = 0
+        for panel_bit, widget_type in (
+            (REFRESH_TELEMETRY, TelemetryPanel),
+            (REFRESH_GROUPS, GroupPanel),
+            (REFRESH_HINT, HintPanel),
+        ):
+            try:
+                panel = self._widget(widget_type)
+            except (LookupError, NoMatches, ScreenStackError):
+                continue
+            parent = panel.parent
+            if not panel.display or (isinstance(parent, Widget) and not parent.region.overlaps(panel.region)):
+                offscreen |= panel_bit
+        revealed = self._skipped_panels & ~offscreen
+        self._offscreen_panels = offscreen
+        self._skipped_panels &= offscreen
+        self._refresh_panels(revealed)
+
     def watch_active_bus(self, active_bus: str) -> None:
         if not self._mounted:
             return
         self._config.active_bus = active_bus
         self._refresh_hint_panel()
-        self._open_bus(active_bus)
+        # Reopening the interface is slow, so cycling through buses quickly only
+        # opens the one the user stops on.
+        if self._bus_switch_timer is not None:
+            self._bus_switch_timer.stop()
+        self._bus_switch_timer = self.set_timer(
+            TUNABLES.bus_switch_delay, lambda: self._commit_bus_switch(active_bus)
+        )
+
+    def _commit_bus_switch(self, channel: str) -> None:
+        self._bus_switch_timer = None
+        if not self._mounted or channel != self.active_bus:
+            return
+        self._open_bus(channel)
         self._schedule_bus_stats_refresh()
         self._refresh_control_panel()
 
     def watch_selected_esc(self, selected_esc: Optional[int]) -> None:
         if not self._mounted:
             return
-        self._refresh_hint_panel()
-        self._refresh_detail_panel()
-        self._refresh_control_panel()
+        self._refresh_panels(REFRESH_HINT | REFRESH_DETAIL | REFRESH_CONTROL)
 
     # --- Actions -----------------------------------------------------------
 
     def action_estop(self) -> None:
         self._stop_demo(disable=False)
-        esc_ids = sorted(set(self._motor_records.keys()) | set(self._motors.keys()))
+        esc_ids = self._sorted_esc_ids()
         if not esc_ids:
             self._log("No motors recorded for E-STOP.")
             return
@@ -1228,14 +1557,14 @@ class DmTuiApp(App[None]):
         self._schedule_discovery(force_active=True)
 
     def action_cycle_bus(self) -> None:
-        channels = [bus.channel for bus in self._config.buses]
+        channels = self._bus_channels
         if not channels:
             self._log("[red]No buses configured.[/red]")
             return
-        if self.active_bus not in channels:
+        index = self._bus_index.get(self.active_bus)
+        if index is None:
             self.active_bus = channels[0]
             return
-        index = channels.index(self.active_bus)
         self.active_bus = channels[(index + 1) % len(channels)]
         self._log(f"Switched active bus to {self.active_bus}.")
 
@@ -1249,7 +1578,7 @@ class DmTuiApp(App[None]):
         except BusManagerError as exc:  # pragma: no cover
             self._log(f"[red]Enable failed:[/red] {exc}")
         else:
-            self._log(f"Enabled ESC 0x{esc_id:02X}.")
+            self._log(f"Enabled ESC {_esc_hex(esc_id)}.")
 
     def action_disable_selected(self) -> None:
         esc_id = self._require_selected_motor()
@@ -1261,7 +1590,7 @@ class DmTuiApp(App[None]):
         except BusManagerError as exc:  # pragma: no cover
             self._log(f"[red]Disable failed:[/red] {exc}")
         else:
-            self._log(f"Disabled ESC 0x{esc_id:02X}.")
+            self._log(f"Disabled ESC {_esc_hex(esc_id)}.")
 
     def action_zero_selected(self) -> None:
         esc_id = self._require_selected_motor()
@@ -1273,7 +1602,7 @@ class DmTuiApp(App[None]):
         except BusManagerError as exc:  # pragma: no cover
             self._log(f"[red]Zero command failed:[/red] {exc}")
         else:
-            self._log(f"Zero command sent to ESC 0x{esc_id:02X}.")
+            self._log(f"Zero command sent to ESC {_esc_hex(esc_id)}.")
 
     def action_set_velocity(self) -> None:
         esc_id = self._require_selected_motor()
@@ -1361,6 +1690,18 @@ class DmTuiApp(App[None]):
         self._persist_config()
         self._log("Configuration saved.")
 
+    def action_reload_config(self) -> None:
+        # Write out motors discovered since the last save so the reload keeps them.
+        if self._persist_timer is not None:
+            self._persist_config()
+        self.run_worker(
+            self._reload_config_worker,
+            name="reload-config",
+            group="config",
+            exclusive=True,
+            thread=True,
+        )
+
     def action_open_command_palette(self) -> None:
         super().action_command_palette()
 
@@ -1384,7 +1725,7 @@ class DmTuiApp(App[None]):
         except BusManagerError as exc:  # pragma: no cover
             self._log(f"[red]Velocity command failed:[/red] {exc}")
         else:
-            self._log(f"Velocity {value:0.2f} rad/s sent to ESC 0x{esc_id:02X}.")
+            self._log(f"Velocity {value:0.2f} rad/s sent to ESC {_esc_hex(esc_id)}.")
 
     def _apply_mit(
         self,
@@ -1420,30 +1761,25 @@ class DmTuiApp(App[None]):
         else:
             if adjustments:
                 self._log(f"[yellow]MIT command clamped ({', '.join(adjustments)}).[/yellow]")
-            self._log(f"MIT command sent to ESC 0x{esc_id:02X}.")
+            self._log(f"MIT command sent to ESC {_esc_hex(esc_id)}.")
 
     def _sanitize_mit_command(
         self,
         command: MitCommand,
         limits: tuple[float, float, float, float, float],
     ) -> tuple[MitCommand, list[str]]:
-        position_limit, velocity_limit, torque_limit, kp_limit, kd_limit = limits
+        values = (command.position_rad, command.velocity_rad_s, command.torque_nm, command.kp, command.kd)
+        clamped_values: list[float] = []
         adjustments: list[str] = []
-
-        def clamp(value: float, minimum: float, maximum: float, label: str) -> float:
-            clamped = max(min(value, maximum), minimum)
+        # One pass over the five fields; gains are clamped to [0, limit], the rest to ±limit.
+        for label, value, limit, signed in zip(self.MIT_FIELD_LABELS, values, limits, self.MIT_FIELD_SIGNED):
+            maximum = abs(limit)
+            minimum = -maximum if signed else 0.0
+            clamped = minimum if value < minimum else maximum if value > maximum else value
             if abs(clamped - value) > 1e-6:
                 adjustments.append(label)
-            return clamped
-
-        sanitized = MitCommand(
-            position_rad=clamp(command.position_rad, -abs(position_limit), abs(position_limit), "position"),
-            velocity_rad_s=clamp(command.velocity_rad_s, -abs(velocity_limit), abs(velocity_limit), "velocity"),
-            torque_nm=clamp(command.torque_nm, -abs(torque_limit), abs(torque_limit), "torque"),
-            kp=clamp(command.kp, 0.0, abs(kp_limit), "kp"),
-            kd=clamp(command.kd, 0.0, abs(kd_limit), "kd"),
-        )
-        return sanitized, adjustments
+            clamped_values.append(clamped)
+        return MitCommand(*clamped_values), adjustments
 
     def _handle_group_action(self, result: Optional[tuple[str, str]]) -> None:
         if result is None:
@@ -1479,8 +1815,7 @@ class DmTuiApp(App[None]):
                 if velocity is None:
                     self._log("[red]Velocity value required.[/red]")
                     return
-                targets = [MotorTarget(esc_id=esc, velocity_rad_s=velocity) for esc in esc_ids]
-                command_velocities(self._bus_manager, targets)
+                command_velocity_all(self._bus_manager, esc_ids, velocity)
                 self._log(f"Velocity {velocity:0.2f} rad/s sent to group '{group_name}'.")
             else:
                 self._log(f"[red]Unknown group action '{action}'.[/red]")
@@ -1494,20 +1829,35 @@ class DmTuiApp(App[None]):
             self._log("[red]Cannot write IDs; bus offline.[/red]")
             return
         self._stop_demo(disable=False)
+        bus = self._bus_manager
+        # Parameter writes and the flash save can stall on a full TX queue; keep them
+        # off the UI thread and apply the bookkeeping once they have gone out.
+        self.run_worker(
+            lambda: self._id_assignment_worker(bus, current_esc, result),
+            name="assign-ids",
+            group="bus",
+            thread=True,
+        )
+
+    def _id_assignment_worker(self, bus: BusManager, current_esc: int, result: IdAssignmentResult) -> None:
         try:
             assign_motor_ids(
-                self._bus_manager,
+                bus,
                 current_esc=current_esc,
                 new_esc=result.esc_id,
                 new_mst=result.mst_id,
                 control_mode=result.control_mode,
             )
-        except BusManagerError as exc:  # pragma: no cover
-            self._log(f"[red]ID assignment failed:[/red] {exc}")
-            return
+        except BusManagerError as exc:  # pragma: no cover - hardware dependent
+            self._log_from_thread(f"[red]ID assignment failed:[/red] {exc}")
+        else:
+            self.call_from_thread(self._finish_id_assignment, current_esc, result)
+
+    def _finish_id_assignment(self, current_esc: int, result: IdAssignmentResult) -> None:
         self._log(
-            f"Assigned ESC 0x{result.esc_id:02X}, MST 0x{result.mst_id:03X}, CTRL_MODE {result.control_mode}."
+            f"Assigned ESC {_esc_hex(result.esc_id)}, MST {_mst_hex(result.mst_id)}, CTRL_MODE {result.control_mode}."
         )
+        self._esc_ids_dirty = True
         record = self._motor_records.pop(current_esc, None)
         if record is None:
             record = MotorRecord(esc_id=result.esc_id, mst_id=result.mst_id)
@@ -1517,6 +1867,7 @@ class DmTuiApp(App[None]):
         record.metadata.setdefault("ctrl_mode", result.control_mode)
         self._motor_records[result.esc_id] = record
         info = self._motors.pop(current_esc, None)
+        self._watchdog_scheduled.pop(current_esc, None)
         if info:
             self._motors[result.esc_id] = MotorInfo(
                 esc_id=result.esc_id,
@@ -1526,23 +1877,18 @@ class DmTuiApp(App[None]):
         tele = self._telemetry.pop(current_esc, None)
         if tele:
             self._telemetry[result.esc_id] = tele
+            self._telemetry_rows = None
         history = self._telemetry_history.pop(current_esc, None)
         if history:
             self._telemetry_history[result.esc_id] = history
-        torque_history = self._torque_history.pop(current_esc, None)
-        if torque_history:
-            self._torque_history[result.esc_id] = torque_history
-        temp_history = self._temp_history.pop(current_esc, None)
-        if temp_history:
-            self._temp_history[result.esc_id] = temp_history
         for group in self._groups.values():
-            group.esc_ids = [result.esc_id if esc == current_esc else esc for esc in group.esc_ids]
+            esc_ids = group.esc_ids
+            if current_esc in esc_ids:
+                esc_ids[esc_ids.index(current_esc)] = result.esc_id
         self._cleanup_empty_groups()
-        self.selected_esc = result.esc_id
-        self._refresh_motor_table()
-        self._refresh_telemetry_panel()
-        self._refresh_detail_panel()
-        self._refresh_group_panel()
+        with self.batch_update():
+            self.selected_esc = result.esc_id
+            self._refresh_panels(REFRESH_TABLE | REFRESH_TELEMETRY | REFRESH_DETAIL | REFRESH_GROUPS)
         self._reapply_filters()
         self._persist_config()
 
@@ -1554,6 +1900,7 @@ class DmTuiApp(App[None]):
             mst_id = self._motors.get(esc_id).mst_id if esc_id in self._motors else esc_id + 0x10
             record = MotorRecord(esc_id=esc_id, mst_id=mst_id)
             self._motor_records[esc_id] = record
+            self._esc_ids_dirty = True
         record.name = update.name
         record.group = update.group
         for key, value in (("p_max", update.p_max), ("v_max", update.v_max), ("t_max", update.t_max)):
@@ -1561,20 +1908,19 @@ class DmTuiApp(App[None]):
                 record.metadata.pop(key, None)
             else:
                 record.metadata[key] = value
-        for group in self._groups.values():
-            if esc_id in group.esc_ids and group.name != (update.group or group.name):
-                group.esc_ids = [e for e in group.esc_ids if e != esc_id]
         if update.group:
+            # Leaving the group field blank keeps existing memberships, so only a named
+            # group moves the motor out of the others.
+            for group in self._groups.values():
+                if group.name != update.group and esc_id in group.esc_ids:
+                    group.esc_ids = [e for e in group.esc_ids if e != esc_id]
             group = self._groups.setdefault(update.group, GroupRecord(name=update.group, esc_ids=[]))
             if esc_id not in group.esc_ids:
                 group.esc_ids.append(esc_id)
         self._cleanup_empty_groups()
-        self._refresh_group_panel()
-        self._refresh_detail_panel()
         self._persist_config()
-        if self._mounted:
-            self._refresh_motor_table()
-        self._log(f"Updated metadata for ESC 0x{esc_id:02X}.")
+        self._refresh_panels(REFRESH_GROUPS | REFRESH_DETAIL | (REFRESH_TABLE if self._mounted else 0))
+        self._log(f"Updated metadata for ESC {_esc_hex(esc_id)}.")
 
     def _apply_group_definition(self, definition: Optional[GroupDefinition]) -> None:
         if definition is None:
@@ -1590,12 +1936,12 @@ class DmTuiApp(App[None]):
         if selection is None:
             return
         demo_key, group_name = selection
-        definition = next((demo for demo in DEMO_DEFINITIONS if demo.key == demo_key), None)
+        definition = DEMO_BY_KEY.get(demo_key)
         if definition is None:
             self._log(f"[red]Demo '{demo_key}' not found.[/red]")
             return
         if group_name == "ALL":
-            esc_ids = sorted(set(self._motor_records.keys()) | set(self._motors.keys()))
+            esc_ids = self._sorted_esc_ids()
             if not esc_ids:
                 self._log("No motors available to run demo.")
                 return
@@ -1612,6 +1958,8 @@ class DmTuiApp(App[None]):
             self._log("[red]Cannot start demo; bus offline.[/red]")
             return
         self._stop_demo(disable=False)
+        from .demos import sine_orchestra
+
         try:
             handle = sine_orchestra(
                 self._bus_manager,
@@ -1637,6 +1985,8 @@ class DmTuiApp(App[None]):
             except Exception:
                 pass
         if self._bus_manager:
+            from .demos import brake_to_zero
+
             try:
                 if disable:
                     disable_all(self._bus_manager, demo.esc_ids)
@@ -1652,21 +2002,40 @@ class DmTuiApp(App[None]):
     def _schedule_discovery(self, *, force_active: bool = False) -> None:
         if not self._mounted or self._bus_manager is None:
             return
-        with self._threads_lock:
-            if self._discovery_running:
-                return
+        if not self._discovery_lock.acquire(blocking=False):
+            return
+        try:
             self._discovery_running = True
-        self._reapply_filters()
-        threading.Thread(target=self._discovery_worker, args=(force_active,), daemon=True).start()
+            self._reapply_filters()
+            # The sniff/probe block in recv() for up to a second; the lock (released by the
+            # worker) keeps a slow pass from piling up behind the next timer tick.
+            self.run_worker(
+                lambda: self._discovery_worker(force_active),
+                name="discovery",
+                group="discovery",
+                thread=True,
+            )
+        except BaseException:
+            # No worker will run to release the gate; free it so the next tick can retry.
+            self._discovery_running = False
+            self._discovery_lock.release()
+            raise
 
     def _schedule_bus_stats_refresh(self) -> None:
         if not self._mounted:
             return
-        with self._threads_lock:
-            if self._bus_stats_running:
-                return
-            self._bus_stats_running = True
-        threading.Thread(target=self._bus_stats_worker, daemon=True).start()
+        if not self._bus_stats_lock.acquire(blocking=False):
+            return
+        try:
+            self.run_worker(
+                self._bus_stats_worker,
+                name="bus-stats",
+                group="bus-stats",
+                thread=True,
+            )
+        except BaseException:
+            self._bus_stats_lock.release()
+            raise
 
     def _watchdog_check(self) -> None:
         bus = self._bus_manager
@@ -1677,27 +2046,33 @@ class DmTuiApp(App[None]):
         cooldown = self._watchdog_cooldown
         changed = False
         stale: list[tuple[int, float]] = []
-        esc_ids = set(self._motors.keys()) | set(self._telemetry.keys())
-        for esc_id in esc_ids:
-            info = self._motors.get(esc_id)
-            telemetry = self._telemetry.get(esc_id)
-            last_seen: float | None = None
-            if info is not None:
-                last_seen = info.last_seen
-            if telemetry is not None:
-                last_seen = (
-                    telemetry.timestamp
-                    if last_seen is None
-                    else max(last_seen, telemetry.timestamp)
-                )
-            if last_seen is None:
+        motors = self._motors
+        heap = self._watchdog_heap
+        scheduled = self._watchdog_scheduled
+        if len(scheduled) != len(motors):
+            for esc_id in motors.keys() - scheduled.keys():
+                self._watchdog_schedule(esc_id, motors[esc_id].last_seen)
+        # Only motors whose scheduled timestamp is past the cutoff can be stale; entries
+        # for motors that reported since are pushed back with their newer timestamp.
+        cutoff = now - threshold
+        overdue: list[tuple[float, int]] = []
+        while heap and heap[0][0] <= cutoff:
+            last_seen, esc_id = heapq.heappop(heap)
+            if scheduled.get(esc_id) != last_seen:
                 continue
-            age = now - last_seen
-            if age < threshold:
+            info = motors.get(esc_id)
+            if info is None:
+                del scheduled[esc_id]
+                continue
+            if info.last_seen > cutoff:
+                self._watchdog_schedule(esc_id, info.last_seen)
                 if esc_id in self._watchdog_tripped:
                     self._watchdog_tripped.discard(esc_id)
                     changed = True
                 continue
+            # Still stale: keep it at the top so the next tick re-checks the cooldown.
+            overdue.append((info.last_seen, esc_id))
+            age = now - info.last_seen
             if esc_id not in self._watchdog_tripped:
                 self._watchdog_tripped.add(esc_id)
                 changed = True
@@ -1705,24 +2080,28 @@ class DmTuiApp(App[None]):
             if last_disable is not None and (now - last_disable) < cooldown:
                 continue
             stale.append((esc_id, age))
+        for last_seen, esc_id in overdue:
+            self._watchdog_schedule(esc_id, last_seen)
         if not stale:
             if changed and self._mounted:
-                self._refresh_motor_table()
-                self._refresh_detail_panel()
+                self._mark_ui_dirty(REFRESH_TABLE | REFRESH_DETAIL)
             return
         for esc_id, age in stale:
             try:
                 disable(bus, esc_id)
             except BusManagerError as exc:  # pragma: no cover - hardware dependent
-                self._log(f"[red]Watchdog disable failed for ESC 0x{esc_id:02X}:[/red] {exc}")
+                self._log(f"[red]Watchdog disable failed for ESC {_esc_hex(esc_id)}:[/red] {exc}")
             else:
                 self._log(
-                    f"[red]Watchdog:[/red] ESC 0x{esc_id:02X} stale ({age:0.1f}s); issued disable."
+                    f"[red]Watchdog:[/red] ESC {_esc_hex(esc_id)} stale ({age:0.1f}s); issued disable."
                 )
             self._watchdog_last_disable[esc_id] = now
         if self._mounted:
-            self._refresh_motor_table()
-            self._refresh_detail_panel()
+            self._mark_ui_dirty(REFRESH_TABLE | REFRESH_DETAIL)
+
+    def _watchdog_schedule(self, esc_id: int, last_seen: float) -> None:
+        self._watchdog_scheduled[esc_id] = last_seen
+        heapq.heappush(self._watchdog_heap, (last_seen, esc_id))
 
     def _discovery_worker(self, force_active: bool) -> None:
         try:
@@ -1737,24 +2116,25 @@ class DmTuiApp(App[None]):
                     now = monotonic()
                     if now - self._last_probe_warning > 15.0:
                         self._last_probe_warning = now
-                        self.call_from_thread(
-                            self._log,
-                            f"[yellow]Discovery warning:[/yellow] active probe skipped ({exc}).",
+                        self._log_from_thread(
+                            f"[yellow]Discovery warning:[/yellow] active probe skipped ({exc})."
                         )
         except Exception as exc:  # pragma: no cover - hardware dependent
-            self.call_from_thread(self._log, f"[red]Discovery error:[/red] {exc}")
+            self._log_from_thread(f"[red]Discovery error:[/red] {exc}")
         else:
             if motors:
                 self.call_from_thread(self._ingest_discovery, motors)
         finally:
-            with self._threads_lock:
-                self._discovery_running = False
+            self._discovery_running = False
+            self._discovery_lock.release()
             try:
                 self.call_from_thread(self._reapply_filters)
             except Exception:  # pragma: no cover - defensive guard during shutdown
                 pass
 
     def _bus_stats_worker(self) -> None:
+        from .osutils import read_bus_statistics
+
         try:
             stats = read_bus_statistics(self.active_bus)
         except Exception as exc:  # pragma: no cover - depends on OS tools
@@ -1762,32 +2142,65 @@ class DmTuiApp(App[None]):
         else:
             self.call_from_thread(self._update_bus_stats, stats)
         finally:
-            with self._threads_lock:
-                self._bus_stats_running = False
+            self._bus_stats_lock.release()
+
+    def _reload_config_worker(self) -> None:
+        try:
+            config = load_config(self._config_path, use_cache=False)
+        except Exception as exc:  # pragma: no cover - filesystem/YAML dependent
+            self._log_from_thread(f"[red]Config reload failed:[/red] {exc}")
+        else:
+            self.call_from_thread(self._apply_reloaded_config, config)
+
+    def _apply_reloaded_config(self, config: AppConfig) -> None:
+        previous_bus = self.active_bus
+        previous_records = self._motor_records
+        previous_groups = self._groups
+        self._apply_config(config)
+        motors_changed = self._motor_records != previous_records
+        groups_changed = self._groups != previous_groups
+        if not motors_changed and not groups_changed and self._config.active_bus == previous_bus:
+            self._log("Configuration unchanged.")
+            return
+        if motors_changed:
+            self._limit_errors.clear()
+        if self._mounted:
+            # Only touch the panels whose backing data differs from what is on screen.
+            if motors_changed:
+                self._reapply_filters()
+            self._refresh_panels(
+                (REFRESH_TABLE | REFRESH_DETAIL if motors_changed else 0)
+                | (REFRESH_GROUPS if groups_changed else 0)
+            )
+        self._log(_describe_reload(previous_records.keys(), self._motor_records.keys()))
+        if self._config.active_bus != previous_bus:
+            self.active_bus = self._config.active_bus
 
     def _ingest_discovery(self, motors: Iterable[MotorInfo]) -> None:
         now = monotonic()
         config_changed = False
         for motor in motors:
-            self._motors[motor.esc_id] = MotorInfo(
-                esc_id=motor.esc_id,
-                mst_id=motor.mst_id,
-                last_seen=now,
-            )
+            info = self._motors.get(motor.esc_id)
+            if info is None:
+                self._esc_ids_dirty = True
+                self._motors[motor.esc_id] = MotorInfo(esc_id=motor.esc_id, mst_id=motor.mst_id, last_seen=now)
+            else:
+                info.mst_id = motor.mst_id
+                info.last_seen = now
             record = self._motor_records.get(motor.esc_id)
             if record is None:
                 record = MotorRecord(esc_id=motor.esc_id, mst_id=motor.mst_id)
                 self._motor_records[motor.esc_id] = record
-                self._config.motors.append(record)
+                self._esc_ids_dirty = True
                 config_changed = True
-                self._log(f"Discovered ESC 0x{motor.esc_id:02X} (MST 0x{motor.mst_id:03X}).")
+                self._log(f"Discovered ESC {_esc_hex(motor.esc_id)} (MST {_mst_hex(motor.mst_id)}).")
             elif record.mst_id != motor.mst_id:
                 record.mst_id = motor.mst_id
                 config_changed = True
-        self._refresh_motor_table()
+        self._mark_ui_dirty(REFRESH_TABLE)
         self._reapply_filters()
         if config_changed:
-            self._persist_config()
+            self._schedule_persist()
 
     def _ingest_feedback(self, esc_id: int, feedback: Feedback, mst_id: int, timestamp: float) -> None:
         if esc_id == 0:
@@ -1802,93 +2215,190 @@ class DmTuiApp(App[None]):
         if record is None:
             record = MotorRecord(esc_id=esc_id, mst_id=mst_id)
             self._motor_records[esc_id] = record
-            self._config.motors.append(record)
+            self._esc_ids_dirty = True
             config_changed = True
-            self._log(f"Telemetry discovered ESC 0x{esc_id:02X} (MST 0x{mst_id:03X}).")
+            self._log(f"Telemetry discovered ESC {_esc_hex(esc_id)} (MST {_mst_hex(mst_id)}).")
         elif record.mst_id != mst_id:
             record.mst_id = mst_id
             config_changed = True
 
-        if self._maybe_update_limits(record):
-            config_changed = True
+        self._maybe_update_limits(record)
 
-        limits = self._resolve_limits(esc_id)
-        engineering = feedback.to_engineering(
-            p_max=limits[0],
-            v_max=limits[1],
-            t_max=limits[2],
-        )
-        telemetry_record = TelemetryRecord(
-            feedback=feedback,
-            timestamp=timestamp,
-            position_rad=engineering.position_rad,
-            velocity_rad_s=engineering.velocity_rad_s,
-            torque_nm=engineering.torque_nm,
-        )
-        self._telemetry[esc_id] = telemetry_record
+        p_max, v_max, t_max = self._resolve_limits(esc_id)
+        # The scaled values feed the record, the CSV row and the history ring directly,
+        # so no FeedbackEngineering is built per frame.
+        position, velocity, torque = feedback.scaled(p_max=p_max, v_max=v_max, t_max=t_max)
+        # Records and MotorInfo entries are overwritten in place: allocating fresh ones for
+        # every frame only feeds the garbage collector.
+        telemetry_record = self._telemetry.get(esc_id)
+        if telemetry_record is None:
+            self._telemetry[esc_id] = TelemetryRecord(feedback, timestamp, position, velocity, torque)
+            self._telemetry_rows = None
+        else:
+            telemetry_record.feedback = feedback
+            telemetry_record.timestamp = timestamp
+            telemetry_record.position_rad = position
+            telemetry_record.velocity_rad_s = velocity
+            telemetry_record.torque_nm = torque
         if esc_id in self._watchdog_tripped:
             self._watchdog_tripped.discard(esc_id)
         self._watchdog_last_disable.pop(esc_id, None)
         writer = self._ensure_telemetry_log()
         if writer is not None:
             try:
-                from . import logging as telemetry_logging
-
-                row = telemetry_logging.telemetry_row_from_engineering(
-                    engineering,
-                    mst_id=mst_id,
-                    timestamp=timestamp,
+                writer.write_row(
+                    telemetry_logging.TelemetryRow(
+                        timestamp,
+                        esc_id,
+                        mst_id,
+                        feedback.status,
+                        position,
+                        velocity,
+                        torque,
+                        feedback.temp_mos,
+                        feedback.temp_rotor,
+                    )
                 )
-                writer.write_row(row)
             except Exception as exc:  # pragma: no cover - depends on filesystem
                 self._log(f"[red]Telemetry log write failed:[/red] {exc}")
                 self._close_telemetry_log(mark_error=True)
-        velocity_history = self._telemetry_history.setdefault(esc_id, deque(maxlen=200))
-        velocity_history.append(engineering.velocity_rad_s)
-        torque_history = self._torque_history.setdefault(esc_id, deque(maxlen=200))
-        torque_history.append(engineering.torque_nm)
-        temp_history = self._temp_history.setdefault(esc_id, deque(maxlen=200))
-        temp_history.append(feedback.temp_mos)
-        self._motors[esc_id] = MotorInfo(esc_id=esc_id, mst_id=mst_id, last_seen=timestamp)
+        history = self._telemetry_history.get(esc_id)
+        if history is None:
+            history = self._telemetry_history[esc_id] = TelemetryHistory()
+        history.append(timestamp, velocity, torque, feedback.temp_mos)
+        info = self._motors.get(esc_id)
+        if info is None:
+            self._esc_ids_dirty = True
+            self._motors[esc_id] = MotorInfo(esc_id=esc_id, mst_id=mst_id, last_seen=timestamp)
+        else:
+            info.mst_id = mst_id
+            info.last_seen = timestamp
         if self.selected_esc is None:
             self.selected_esc = esc_id
         if self._mounted:
-            self._refresh_motor_table()
-            self._refresh_telemetry_panel()
-            self._refresh_detail_panel()
-            self._refresh_velocity_sparkline()
-            self._reapply_filters()
+            # Panels are redrawn by the UI refresh timer rather than once per frame.
+            self._ui_dirty |= REFRESH_TABLE | REFRESH_TELEMETRY | REFRESH_DETAIL
+            if config_changed:
+                self._reapply_filters()
         if config_changed:
-            self._persist_config()
+            self._schedule_persist()
+
+    def _flush_telemetry_refresh(self) -> None:
+        frames = self._rx_frames
+        if not frames and not self._ui_dirty:
+            self._idle_ui_refresh()
+            return
+        while frames:
+            data, arbitration_id, timestamp = frames.popleft()
+            try:
+                feedback = protocol.decode_feedback(data)
+            except ValueError:
+                continue
+            self._ingest_feedback(feedback.esc_id, feedback, arbitration_id, timestamp)
+        panels, self._ui_dirty = self._ui_dirty, 0
+        self._refresh_panels(panels)
+
+    def _mark_ui_dirty(self, panels: int) -> None:
+        """Queue *panels* for the next UI refresh tick, waking the tick if it is paused."""
+
+        self._ui_dirty |= panels
+        if self._ui_refresh_idle:
+            self._ui_refresh_idle = False
+            timer = self._ui_refresh_timer
+            if timer is not None:
+                timer.resume()
+
+    def _idle_ui_refresh(self) -> None:
+        """Pause the UI refresh tick until the notifier thread queues another frame."""
+
+        timer = self._ui_refresh_timer
+        if timer is None:
+            return
+        self._ui_refresh_idle = True
+        timer.pause()
+        # A frame queued before the flag was raised would not wake the timer, so look again.
+        if self._rx_frames:
+            self._ui_refresh_idle = False
+            timer.resume()
+
+    def _widget(self, widget_type: type[_W]) -> _W:
+        """Return the main-screen panel of *widget_type*, querying the DOM only once."""
+
+        widget = self._widgets.get(widget_type)
+        if widget is None:
+            widget = self._widgets[widget_type] = self.query_one(widget_type)
+        return widget  # type: ignore[return-value]
 
     def _update_bus_stats(self, stats: Dict[str, object]) -> None:
-        panel = self.query_one(BusStatusPanel)
+        panel = self._widget(BusStatusPanel)
         panel.update_stats(self.active_bus, stats)
 
     def _update_bus_error(self, message: str) -> None:
-        panel = self.query_one(BusStatusPanel)
+        panel = self._widget(BusStatusPanel)
         panel.update_error(self.active_bus, message)
 
-    def _refresh_motor_table(self) -> None:
-        table = self.query_one(MotorTable)
-        table.update_rows(
-            self._motors,
-            self._motor_records,
-            monotonic(),
-            telemetry=self._telemetry,
-            watchdog_tripped=self._watchdog_tripped,
-            last_disable=self._watchdog_last_disable,
-        )
-        available = table.available_esc_ids()
-        if not available:
-            self.selected_esc = None
+    def _refresh_panels(self, panels: int) -> None:
+        """Refresh every panel flagged in *panels* (``REFRESH_*`` bits) in one repaint."""
+
+        hidden = panels & self._offscreen_panels
+        if hidden:
+            # Static.update forces a layout pass even for clipped panels; redraw them once revealed.
+            self._skipped_panels |= hidden
+            panels &= ~hidden
+        if not panels:
             return
-        if self.selected_esc not in available:
-            self.selected_esc = available[0]
-        table.focus_esc(self.selected_esc or available[0])
+        # One clock sample per cycle so every "age" shown in this repaint agrees.
+        now = monotonic()
+        with self.batch_update():
+            if panels & REFRESH_TABLE:
+                self._refresh_motor_table(now)
+            if panels & REFRESH_TELEMETRY:
+                self._refresh_telemetry_panel(now)
+            if panels & REFRESH_DETAIL:
+                # Also redraws the sparkline and control panel.
+                self._refresh_detail_panel(now)
+            elif panels & REFRESH_CONTROL:
+                self._refresh_control_panel()
+            if panels & REFRESH_GROUPS:
+                self._refresh_group_panel()
+            if panels & REFRESH_HINT:
+                self._refresh_hint_panel()
+
+    def _refresh_motor_table(self, now: float | None = None) -> None:
+        table = self._widget(MotorTable)
+        with self.batch_update():
+            rebuilt = table.update_rows(
+                self._motors,
+                self._motor_records,
+                monotonic() if now is None else now,
+                telemetry=self._telemetry,
+                watchdog_tripped=self._watchdog_tripped,
+                last_disable=self._watchdog_last_disable,
+                esc_ids=self._sorted_esc_ids(),
+            )
+            # Same rows and same selection as last time: the cursor is already in place.
+            if not rebuilt and self.selected_esc == self._table_focus:
+                return
+            available = table.available_esc_ids()
+            if not available:
+                self.selected_esc = None
+                self._table_focus = None
+                return
+            if self.selected_esc not in available:
+                self.selected_esc = available[0]
+            self._table_focus = self.selected_esc or available[0]
+            table.focus_esc(self._table_focus)
+
+    def _sorted_esc_ids(self) -> list[int]:
+        if self._esc_ids_dirty:
+            self._known_esc_ids = sorted(
+                self._motor_records.keys() | self._motors.keys() | self._telemetry.keys()
+            )
+            self._esc_ids_dirty = False
+        return self._known_esc_ids
 
-    def _refresh_detail_panel(self) -> None:
-        panel = self.query_one(MotorDetailPanel)
+    def _refresh_detail_panel(self, now: float | None = None) -> None:
+        panel = self._widget(MotorDetailPanel)
         esc_id = self.selected_esc
         if esc_id is None:
             panel.show_idle()
@@ -1900,36 +2410,39 @@ class DmTuiApp(App[None]):
             record=self._motor_records.get(esc_id),
             info=self._motors.get(esc_id),
             telemetry=self._telemetry.get(esc_id),
-            now=monotonic(),
+            now=monotonic() if now is None else now,
             watchdog_active=esc_id in self._watchdog_tripped,
             watchdog_last=self._watchdog_last_disable.get(esc_id),
         )
         self._refresh_velocity_sparkline()
         self._refresh_control_panel()
 
-    def _refresh_telemetry_panel(self) -> None:
-        panel = self.query_one(TelemetryPanel)
-        panel.update_rows(self._telemetry, monotonic())
+    def _refresh_telemetry_panel(self, now: float | None = None) -> None:
+        panel = self._widget(TelemetryPanel)
+        rows = self._telemetry_rows
+        if rows is None:
+            rows = self._telemetry_rows = tuple(heapq.nsmallest(panel.MAX_ROWS, self._telemetry))
+        panel.update_rows(self._telemetry, monotonic() if now is None else now, esc_ids=rows)
 
     def _refresh_group_panel(self) -> None:
-        panel = self.query_one(GroupPanel)
+        panel = self._widget(GroupPanel)
         panel.update_groups(self._groups)
 
     def _refresh_velocity_sparkline(self) -> None:
-        panel = self.query_one(VelocitySparkline)
+        panel = self._widget(VelocitySparkline)
         esc_id = self.selected_esc
-        history = self._telemetry_history.get(esc_id, []) if esc_id is not None else []
-        panel.update_series(esc_id, history)
+        history = self._telemetry_history.get(esc_id) if esc_id is not None else None
+        panel.show_history(esc_id, history)
 
     def _refresh_hint_panel(self) -> None:
-        panel = self.query_one(HintPanel)
+        panel = self._widget(HintPanel)
         panel.update_hints(self.active_bus, self.selected_esc)
 
     def _refresh_control_panel(self) -> None:
         if not self._mounted:
             return
         try:
-            panel = self.query_one(MotorControlPanel)
+            panel = self._widget(MotorControlPanel)
         except (LookupError, NoMatches):
             return
         panel.update_controls(self.selected_esc, bus_online=self._bus_manager is not None)
@@ -1949,10 +2462,11 @@ class DmTuiApp(App[None]):
             self._log(f"[red]Bus {channel} unavailable:[/red] {exc}")
             return
         self._bus_manager = manager
+        self._rx_frames.clear()
         self._telemetry.clear()
+        self._telemetry_rows = None
+        self._esc_ids_dirty = True
         self._telemetry_history.clear()
-        self._torque_history.clear()
-        self._temp_history.clear()
         self._watchdog_tripped.clear()
         self._watchdog_last_disable.clear()
         manager.register_listener(self._handle_bus_message)
@@ -1971,15 +2485,17 @@ class DmTuiApp(App[None]):
             self._bus_manager = None
         self._refresh_control_panel()
 
-    def _ensure_telemetry_log(self) -> "TelemetryCsvWriter | None":
+    def _ensure_telemetry_log(self) -> "telemetry_logging.QueuedCsvWriter | None":
         if self._telemetry_log_writer is not None:
             return self._telemetry_log_writer
         if self._telemetry_log_error:
             return None
         try:
-            from . import logging as telemetry_logging
-
-            self._telemetry_log_writer = telemetry_logging.open_csv(self._telemetry_log_path)
+            # Rows are written on a background thread so disk stalls never block the UI.
+            self._telemetry_log_writer = telemetry_logging.QueuedCsvWriter(
+                telemetry_logging.open_csv(self._telemetry_log_path),
+                max_pending=TUNABLES.log_queue_limit,
+            )
         except Exception as exc:  # pragma: no cover - filesystem/permissions dependent
             self._telemetry_log_error = True
             self._log(f"[red]Telemetry log unavailable:[/red] {exc}")
@@ -2000,7 +2516,23 @@ class DmTuiApp(App[None]):
             if mark_error:
                 self._telemetry_log_error = True
 
+    def _schedule_persist(self) -> None:
+        """Save the config shortly, folding a burst of discoveries into one write."""
+
+        if not self.is_running:
+            self._persist_config()
+            return
+        if self._persist_timer is None:
+            self._persist_timer = self.set_timer(TUNABLES.config_save_delay, self._flush_scheduled_persist)
+
+    def _flush_scheduled_persist(self) -> None:
+        self._persist_timer = None
+        self._persist_config()
+
     def _persist_config(self) -> None:
+        timer, self._persist_timer = self._persist_timer, None
+        if timer is not None:
+            timer.stop()
         self._config.motors = list(self._motor_records.values())
         self._config.active_bus = self.active_bus
         self._cleanup_empty_groups()
@@ -2011,74 +2543,130 @@ class DmTuiApp(App[None]):
         save_config(self._config, self._config_path)
 
     def _log(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        text = f"[{timestamp}] {message}"
-        try:
-            log = self.query_one(ActivityLog)
-        except (LookupError, ScreenStackError):
-            pass
-        else:
-            log.write_line(text)
+        if self._mounted:
+            timestamp = strftime("%H:%M:%S")
+            # Handlers often log several lines in a row; write them to the widget together
+            # once the current handler returns.
+            self._log_pending.append(f"[{timestamp}] {message}")
+            if len(self._log_pending) == 1:
+                self.call_later(self._flush_log)
         self.console.log(message)
 
-    def _handle_bus_message(self, message) -> None:  # pragma: no cover - runtime path
+    def _log_from_thread(self, message: str) -> None:
+        """Queue *message* from a worker thread without waiting on the event loop."""
+
+        self._log_inbox.append(message)
+        if self._log_inbox_scheduled:
+            return
+        self._log_inbox_scheduled = True
+        loop = self._loop
+        if loop is None:
+            self._drain_log_inbox()
+        else:
+            try:
+                loop.call_soon_threadsafe(self._drain_log_inbox)
+            except RuntimeError:  # pragma: no cover - loop closed during shutdown
+                pass
+
+    def _drain_log_inbox(self) -> None:
+        # Lower the flag before draining: a message appended after this point either
+        # gets drained below or schedules another drain.
+        self._log_inbox_scheduled = False
+        inbox = self._log_inbox
+        while inbox:
+            self._log(inbox.popleft())
+
+    def _flush_log(self) -> None:
+        lines, self._log_pending = self._log_pending, []
         try:
-            feedback = protocol.decode_feedback(message.data)
-        except ValueError:
+            log = self._widget(ActivityLog)
+        except (LookupError, ScreenStackError):
             return
-        timestamp = monotonic()
-        self.call_from_thread(
-            self._ingest_feedback,
-            feedback.esc_id,
-            feedback,
-            message.arbitration_id,
-            timestamp,
-        )
+        log.write_lines(lines)
+
+    def _handle_bus_message(self, message) -> None:  # pragma: no cover - runtime path
+        # Runs on the notifier thread: only queue the frame; the UI tick decodes and ingests.
+        self._rx_frames.append((bytes(message.data), message.arbitration_id, monotonic()))
+        if self._ui_refresh_idle:
+            self._ui_refresh_idle = False
+            timer = self._ui_refresh_timer
+            if timer is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(timer.resume)
+
+    def _maybe_update_limits(self, record: MotorRecord) -> None:
+        """Fetch *record*'s limit RIDs in the background unless they are known or pending."""
 
-    def _maybe_update_limits(self, record: MotorRecord) -> bool:
         esc_id = record.esc_id
-        metadata = record.metadata
-        if _has_limit_metadata(metadata):
+        if esc_id in self._limits_loaded or esc_id in self._limits_inflight:
+            return
+        if _has_limit_metadata(record.metadata):
             self._limits_loaded.add(esc_id)
-            return False
+            return
         if esc_id in self._limit_errors:
-            return False
+            return
         bus = self._bus_manager
         if bus is None:
-            return False
-        try:
-            refresh_params(bus, esc_id)
-        except BusManagerError as exc:  # pragma: no cover - hardware dependent
-            if esc_id not in self._limit_errors:
-                self._log(
-                    f"[yellow]Warning:[/yellow] Refresh limits failed for ESC 0x{esc_id:02X}: {exc}"
+            return
+        # RID reads wait up to 0.3 s for replies; frames keep using the default limits
+        # until the worker reports back.
+        self._limits_inflight.add(esc_id)
+        self.run_worker(
+            lambda: self._limits_worker(bus, esc_id),
+            name=f"limits-{esc_id:02X}",
+            group="limits",
+            thread=True,
+        )
+
+    def _limits_worker(self, bus: BusManager, esc_id: int) -> None:
+        # Replies are read from the shared bus buffer, so one fetch at a time.
+        with self._limits_lock:
+            try:
+                refresh_params(bus, esc_id)
+            except Exception as exc:  # pragma: no cover - hardware dependent
+                self.call_from_thread(
+                    self._fail_limits_fetch, esc_id, f"Refresh limits failed for ESC {_esc_hex(esc_id)}: {exc}"
                 )
-            self._limit_errors.add(esc_id)
-            return False
-        try:
-            p_max = _coerce_positive(
-                read_param_float(bus, esc_id, params.RID_P_MAX, timeout=0.3),
-                DEFAULT_P_MAX,
-            )
-            v_max = _coerce_positive(
-                read_param_float(bus, esc_id, params.RID_V_MAX, timeout=0.3),
-                DEFAULT_V_MAX,
-            )
-            t_max = _coerce_positive(
-                read_param_float(bus, esc_id, params.RID_T_MAX, timeout=0.3),
-                DEFAULT_T_MAX,
-            )
-        except BusManagerError as exc:  # pragma: no cover - hardware dependent
-            if esc_id not in self._limit_errors:
-                self._log(
-                    f"[yellow]Warning:[/yellow] RID reads failed for ESC 0x{esc_id:02X}: {exc}"
+                return
+            try:
+                limits = read_param_floats(
+                    bus,
+                    esc_id,
+                    (params.RID_P_MAX, params.RID_V_MAX, params.RID_T_MAX),
+                    timeout=0.3,
+                )
+            except Exception as exc:
+                # Unwrapped python-can errors and bad replies too: the ESC must leave
+                # _limits_inflight, and an escaped exception would exit the app.
+                self.call_from_thread(
+                    self._fail_limits_fetch, esc_id, f"RID reads failed for ESC {_esc_hex(esc_id)}: {exc}"
                 )
-            self._limit_errors.add(esc_id)
-            return False
-        metadata.update({"p_max": p_max, "v_max": v_max, "t_max": t_max})
+                return
+        self.call_from_thread(self._finish_limits_fetch, esc_id, limits)
+
+    def _fail_limits_fetch(self, esc_id: int, message: str) -> None:
+        self._limits_inflight.discard(esc_id)
+        if esc_id not in self._limit_errors:
+            self._log(f"[yellow]Warning:[/yellow] {message}")
+        self._limit_errors.add(esc_id)
+
+    def _finish_limits_fetch(self, esc_id: int, limits: Sequence[float]) -> None:
+        self._limits_inflight.discard(esc_id)
+        record = self._motor_records.get(esc_id)
+        if record is None:
+            return
+        p_raw, v_raw, t_raw = limits
+        record.metadata.update(
+            {
+                "p_max": _coerce_positive(p_raw, DEFAULT_P_MAX),
+                "v_max": _coerce_positive(v_raw, DEFAULT_V_MAX),
+                "t_max": _coerce_positive(t_raw, DEFAULT_T_MAX),
+            }
+        )
         self._limits_loaded.add(esc_id)
         self._limit_errors.discard(esc_id)
-        return True
+        self._schedule_persist()
+        if self._mounted:
+            self._mark_ui_dirty(REFRESH_TABLE | REFRESH_DETAIL)
 
     def _resolve_limits(self, esc_id: int) -> tuple[float, float, float]:
         record = self._motor_records.get(esc_id)
@@ -2100,23 +2688,35 @@ class DmTuiApp(App[None]):
         return p_max, v_max, t_max, kp_max, kd_max
 
     def _reapply_filters(self) -> None:
-        if not self._bus_manager:
+        bus = self._bus_manager
+        if not bus:
             return
         mst_ids = [record.mst_id for record in self._motor_records.values() if record.mst_id]
+        catch_all = self._discovery_running or not mst_ids
+        # Skip the rebuild and the driver call when this bus already has these filters.
+        signature = (bus, frozenset(mst_ids), catch_all)
+        if signature == self._filter_signature:
+            return
         filters = protocol.build_filters(mst_ids)
-        if self._discovery_running or not mst_ids:
+        if catch_all:
             catch_all_filter = {"can_id": 0, "can_mask": 0, "extended": 0}
             if catch_all_filter not in filters:
                 filters.append(catch_all_filter)
         try:
-            self._bus_manager.set_filters(filters)
+            bus.set_filters(filters)
         except BusManagerError as exc:  # pragma: no cover
+            self._filter_signature = None
             self._log(f"[yellow]Warning:[/yellow] failed to apply filters: {exc}")
+        else:
+            self._filter_signature = signature
 
     def _cleanup_empty_groups(self) -> None:
-        empty = [name for name, group in self._groups.items() if not group.esc_ids]
-        for name in empty:
-            del self._groups[name]
+        groups = self._groups
+        if all(group.esc_ids for group in groups.values()):
+            return
+        # Delete in place: open modals and the group panel hold this same dict.
+        for name in [name for name, group in groups.items() if not group.esc_ids]:
+            del groups[name]
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         table = getattr(event, "data_table", None)
@@ -2145,6 +2745,7 @@ class DmTuiApp(App[None]):
             ("Stop Demo", "Stop any running demo and disable motors.", self.action_stop_demo),
             ("Group Actions", "Run enable/disable/velocity against a group.", self.action_prompt_group_action),
             ("Save Config", "Persist current configuration to disk.", self.action_save_config),
+            ("Reload Config", "Re-read configuration from disk.", self.action_reload_config),
             ("Trigger Discovery", "Run passive + active motor discovery.", self.action_trigger_discovery),
         ]
         for text, help_text, func in commands:
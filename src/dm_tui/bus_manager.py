@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from threading import Lock
+from threading import Lock, RLock
 from typing import Callable, Iterable, Optional
 
 try:
@@ -102,6 +102,9 @@ class BusManager:
         self._notifier: Optional["can.Notifier"] = None
         self._callback_listener = _CallbackListener()
         self._reader = can.BufferedReader()
+        # Held around every send so a send_many burst is never interleaved with frames
+        # from other threads; owned here rather than borrowed from python-can internals.
+        self._send_lock = RLock()
 
     @property
     def bus(self) -> "can.BusABC":
@@ -150,8 +153,24 @@ class BusManager:
 
     def send(self, arbitration_id: int, data: bytes, *, extended_id: bool = False) -> None:
         message = can.Message(arbitration_id=arbitration_id, data=data, is_extended_id=extended_id)
+        bus = self.bus
         try:
-            self.bus.send(message)
+            with self._send_lock:
+                bus.send(message)
+        except can.CanError as exc:  # pragma: no cover - hardware dependent
+            raise BusManagerError(f"Failed to send message: {exc}") from exc
+
+    def send_many(self, frames: Iterable[tuple[int, bytes]], *, extended_id: bool = False) -> None:
+        """Send *frames* back-to-back, holding the send lock once for the whole burst."""
+        messages = [
+            can.Message(arbitration_id=arbitration_id, data=data, is_extended_id=extended_id)
+            for arbitration_id, data in frames
+        ]
+        bus = self.bus
+        try:
+            with self._send_lock:
+                for message in messages:
+                    bus.send(message)
         except can.CanError as exc:  # pragma: no cover - hardware dependent
             raise BusManagerError(f"Failed to send message: {exc}") from exc
 
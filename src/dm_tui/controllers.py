@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from struct import unpack
 from time import monotonic
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from .bus_manager import BusManager
 from .bus_manager import BusManagerError
@@ -50,23 +50,27 @@ def zero(bus: BusManager, esc_id: int) -> None:
 
 
 def enable_all(bus: BusManager, esc_ids: Iterable[int]) -> None:
-    for esc_id in esc_ids:
-        enable(bus, esc_id)
+    bus.send_many([protocol.frame_enable(esc_id) for esc_id in esc_ids])
 
 
 def disable_all(bus: BusManager, esc_ids: Iterable[int]) -> None:
-    for esc_id in esc_ids:
-        disable(bus, esc_id)
+    # One burst under the send lock, so an E-STOP is not interleaved with other traffic.
+    bus.send_many([protocol.frame_disable(esc_id) for esc_id in esc_ids])
 
 
 def command_velocities(bus: BusManager, targets: Iterable[MotorTarget]) -> None:
-    for target in targets:
-        arb_id, data = protocol.frame_speed(target.esc_id, target.velocity_rad_s)
-        bus.send(arb_id, data)
+    frames = [protocol.frame_speed(target.esc_id, target.velocity_rad_s) for target in targets]
+    bus.send_many(frames)
 
 
 def command_velocity(bus: BusManager, esc_id: int, velocity_rad_s: float) -> None:
-    command_velocities(bus, [MotorTarget(esc_id=esc_id, velocity_rad_s=velocity_rad_s)])
+    arb_id, data = protocol.frame_speed(esc_id, velocity_rad_s)
+    bus.send(arb_id, data)
+
+
+def command_velocity_all(bus: BusManager, esc_ids: Iterable[int], velocity_rad_s: float) -> None:
+    """Send one velocity to every ESC in *esc_ids* as a single burst."""
+    bus.send_many(protocol.frames_speed(esc_ids, velocity_rad_s))
 
 
 def command_mit(
@@ -105,8 +109,8 @@ def command_mit(
 
 
 def command_mit_targets(bus: BusManager, targets: Iterable[MitTarget]) -> None:
-    for target in targets:
-        arb_id, data = protocol.frame_mit(
+    frames = [
+        protocol.frame_mit(
             target.esc_id,
             position_rad=target.position_rad,
             velocity_rad_s=target.velocity_rad_s,
@@ -119,19 +123,33 @@ def command_mit_targets(bus: BusManager, targets: Iterable[MitTarget]) -> None:
             kp_limit=target.kp_limit,
             kd_limit=target.kd_limit,
         )
-        bus.send(arb_id, data)
+        for target in targets
+    ]
+    bus.send_many(frames)
 
 
 def read_param(bus: BusManager, esc_id: int, rid: int, *, timeout: float = 0.5) -> int:
     """Read *rid* from *esc_id*, returning the raw 32-bit value."""
 
-    arb_id, payload = protocol.frame_param_read(esc_id, rid)
-    bus.send(arb_id, payload)
+    return read_params(bus, esc_id, (rid,), timeout=timeout)[0]
+
+
+def read_params(bus: BusManager, esc_id: int, rids: Sequence[int], *, timeout: float = 0.5) -> list[int]:
+    """Read every RID in *rids* from *esc_id*, returning raw values in the same order.
+
+    All read requests go out back-to-back before any reply is awaited, so the
+    round-trips overlap and *timeout* bounds the whole batch.
+    """
+
+    wanted = set(rids)
+    bus.send_many(protocol.frame_param_read(esc_id, rid) for rid in wanted)
+    values: dict[int, int] = {}
     deadline = monotonic() + max(timeout, 0.0)
-    while True:
+    while len(values) < len(wanted):
         remaining = deadline - monotonic()
         if remaining <= 0:
-            break
+            missing = ", ".join(f"0x{rid:02X}" for rid in sorted(wanted - values.keys()))
+            raise BusManagerError(f"Timed out waiting for RID {missing} from ESC 0x{esc_id:02X}")
         message = bus.get_message(timeout=min(0.05, remaining))
         if message is None:
             continue
@@ -145,20 +163,28 @@ def read_param(bus: BusManager, esc_id: int, rid: int, *, timeout: float = 0.5)
             continue
         if response.esc_id != esc_id:
             continue
-        if response.rid != rid:
+        if response.rid not in wanted:
             continue
-        return response.value
-    raise BusManagerError(
-        f"Timed out waiting for RID 0x{rid:02X} from ESC 0x{esc_id:02X}"
-    )
+        values[response.rid] = response.value
+    return [values[rid] for rid in rids]
+
+
+def _register_to_float(value: int) -> float:
+    return float(unpack("<f", value.to_bytes(4, "little", signed=False))[0])
 
 
 def read_param_float(bus: BusManager, esc_id: int, rid: int, *, timeout: float = 0.5) -> float:
     """Read *rid* from *esc_id* and interpret the response as a little-endian float."""
 
-    value = read_param(bus, esc_id, rid, timeout=timeout)
-    data = value.to_bytes(4, "little", signed=False)
-    return float(unpack("<f", data)[0])
+    return _register_to_float(read_param(bus, esc_id, rid, timeout=timeout))
+
+
+def read_param_floats(
+    bus: BusManager, esc_id: int, rids: Sequence[int], *, timeout: float = 0.5
+) -> list[float]:
+    """Float variant of :func:`read_params`."""
+
+    return [_register_to_float(value) for value in read_params(bus, esc_id, rids, timeout=timeout)]
 
 
 def write_param(bus: BusManager, esc_id: int, rid: int, value: int) -> None:
@@ -9,7 +9,6 @@ from time import monotonic
 from typing import Callable, Iterable, List, Sequence
 
 from .bus_manager import BusManager
-from .controllers import MotorTarget, command_velocities
 from .dmlib import protocol
 
 _UPDATE_INTERVAL = 0.05
@@ -29,18 +28,18 @@ class DemoHandle:
         self._stopper()
 
 
-def _compute_velocity(mode: str, amplitude: float, base_phase: float, index: int, count: int) -> float:
+def _phase_offsets(mode: str, count: int) -> tuple[float, ...]:
+    """Return the constant per-motor phase offset for *mode* across *count* motors."""
+
     if count <= 1:
-        return amplitude * math.sin(base_phase)
+        return (0.0,) * count
     if mode == "sine":
-        phase = base_phase + (2 * math.pi * index / count)
-    elif mode == "antiphase":
-        phase = base_phase + (math.pi if index % 2 else 0)
-    elif mode == "figure8":
-        phase = base_phase + (index * math.pi / 2)
-    else:
-        phase = base_phase
-    return amplitude * math.sin(phase)
+        return tuple(2 * math.pi * index / count for index in range(count))
+    if mode == "antiphase":
+        return tuple(math.pi if index % 2 else 0.0 for index in range(count))
+    if mode == "figure8":
+        return tuple(index * math.pi / 2 for index in range(count))
+    return (0.0,) * count
 
 
 def sine_orchestra(
@@ -59,26 +58,34 @@ def sine_orchestra(
 
     period_hz = max(20.0, frequency_hz * 16.0)
     tasks = []
-    count = len(esc_list)
-    base_phase = 0.0
-    for index, esc in enumerate(esc_list):
-        velocity = _compute_velocity(mode, amplitude_rps, base_phase, index, count)
-        arb_id, payload = protocol.frame_speed(esc, velocity)
+    # Offsets and angular rate are fixed for the demo's lifetime, so compute them once.
+    offsets = _phase_offsets(mode, len(esc_list))
+    omega = 2 * math.pi * frequency_hz
+    for esc, offset in zip(esc_list, offsets):
+        arb_id, payload = protocol.frame_speed(esc, amplitude_rps * math.sin(offset))
         task = bus.send_periodic(arb_id, payload, hz=period_hz)
         tasks.append(task)
+    # sin(phase + offset) = sin(phase)·cos(offset) + cos(phase)·sin(offset): with the
+    # amplitude folded into per-motor coefficients, each tick needs just one sin/cos pair.
+    channels = tuple(
+        (task, amplitude_rps * math.cos(offset), amplitude_rps * math.sin(offset))
+        for task, offset in zip(tasks, offsets)
+    )
 
     stop_event = threading.Event()
     start_time = monotonic()
 
     def _update_loop() -> None:
+        # The periodic tasks already carry each motor's arbitration ID; only the payload changes.
+        pack_speed = protocol.pack_speed_payload
         while not stop_event.wait(_UPDATE_INTERVAL):
-            now = monotonic()
-            phase_base = 2 * math.pi * frequency_hz * (now - start_time)
-            for index, esc in enumerate(esc_list):
-                velocity = _compute_velocity(mode, amplitude_rps, phase_base, index, count)
-                _, payload = protocol.frame_speed(esc, velocity)
+            phase_base = omega * (monotonic() - start_time)
+            sin_base = math.sin(phase_base)
+            cos_base = math.cos(phase_base)
+            for task, cos_coeff, sin_coeff in channels:
+                payload = pack_speed(sin_base * cos_coeff + cos_base * sin_coeff)
                 try:
-                    tasks[index].update(data=payload)
+                    task.update(data=payload)
                 except Exception:
                     # Ensure the loop keeps running even if a single update fails.
                     continue
@@ -111,6 +118,6 @@ def sine_orchestra(
 def brake_to_zero(bus: BusManager, esc_ids: Iterable[int]) -> None:
     """Broadcast zero velocity commands to the provided ESC IDs."""
 
-    targets = [MotorTarget(esc_id=esc_id, velocity_rad_s=0.0) for esc_id in esc_ids]
-    if targets:
-        command_velocities(bus, targets)
+    frames = protocol.frames_speed(esc_ids, 0.0)
+    if frames:
+        bus.send_many(frames)
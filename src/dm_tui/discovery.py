@@ -26,10 +26,13 @@ def passive_sniff(bus: BusManager, duration: float = 1.0) -> list[MotorInfo]:
     """
 
     seen: dict[tuple[int, int], MotorInfo] = {}
-    deadline = monotonic() + duration
+    now = monotonic()
+    deadline = now + duration
 
-    while monotonic() < deadline:
+    # One clock read per received frame serves both the deadline check and last_seen.
+    while now < deadline:
         message = bus.get_message(timeout=0.05)
+        now = monotonic()
         if message is None:
             continue
         try:
@@ -40,7 +43,7 @@ def passive_sniff(bus: BusManager, duration: float = 1.0) -> list[MotorInfo]:
         seen[key] = MotorInfo(
             esc_id=feedback.esc_id,
             mst_id=message.arbitration_id,
-            last_seen=monotonic(),
+            last_seen=now,
         )
     return list(seen.values())
 
@@ -70,9 +73,11 @@ def active_probe(
         bus.send(*protocol.frame_disable(esc_id))
         bus.send(*protocol.frame_speed(esc_id, 0.0))
         sleep(0.01)
-        deadline = monotonic() + probe_duration
-        while monotonic() < deadline:
+        now = monotonic()
+        deadline = now + probe_duration
+        while now < deadline:
             message = bus.get_message(timeout=0.05)
+            now = monotonic()
             if message is None:
                 continue
             try:
@@ -85,12 +90,14 @@ def active_probe(
             discovered[key] = MotorInfo(
                 esc_id=feedback.esc_id,
                 mst_id=message.arbitration_id,
-                last_seen=monotonic(),
+                last_seen=now,
             )
             break
     # Drain remaining buffered frames within allotted window.
-    while monotonic() < end_time:
+    now = monotonic()
+    while now < end_time:
         message = bus.get_message(timeout=0.01)
+        now = monotonic()
         if message is None:
             break
         try:
@@ -101,6 +108,6 @@ def active_probe(
         discovered[key] = MotorInfo(
             esc_id=feedback.esc_id,
             mst_id=message.arbitration_id,
-            last_seen=monotonic(),
+            last_seen=now,
         )
     return list(discovered.values())
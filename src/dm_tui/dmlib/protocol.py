@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import isfinite
-from struct import pack, unpack
+from struct import Struct
 from typing import Iterable
 
 from . import params
@@ -14,6 +14,12 @@ DISABLE_FRAME = bytes([0xFF] * 7 + [0xFD])
 ZERO_FRAME = bytes([0xFF] * 7 + [0xFE])
 MANAGEMENT_ARBITRATION_ID = 0x7FF
 
+# Compiled once so per-frame packing/decoding skips format-string lookup.
+_SPEED_STRUCT = Struct("<f4x")
+_POSITION_SPEED_STRUCT = Struct("<ff")
+# status|esc, position (signed 16-bit), three bytes of packed 12-bit velocity/torque, temps.
+_FEEDBACK_STRUCT = Struct(">BhBBBBB")
+
 MIT_DEFAULT_POSITION_LIMIT = 12.0
 MIT_DEFAULT_VELOCITY_LIMIT = 30.0
 MIT_DEFAULT_TORQUE_LIMIT = 20.0
@@ -33,15 +39,19 @@ class Feedback:
     temp_mos: int
     temp_rotor: int
 
+    def scaled(self, *, p_max: float, v_max: float, t_max: float) -> tuple[float, float, float]:
+        """Return ``(position_rad, velocity_rad_s, torque_nm)`` for the given limits."""
+
+        return (
+            self.position_raw / 32767.0 * p_max,
+            self.velocity_raw / 2047.0 * v_max,
+            self.torque_raw / 2047.0 * t_max,
+        )
+
     def to_engineering(self, *, p_max: float, v_max: float, t_max: float) -> "FeedbackEngineering":
+        position, velocity, torque = self.scaled(p_max=p_max, v_max=v_max, t_max=t_max)
         return FeedbackEngineering(
-            esc_id=self.esc_id,
-            status=self.status,
-            position_rad=self.position_raw / 32767.0 * p_max,
-            velocity_rad_s=self.velocity_raw / 2047.0 * v_max,
-            torque_nm=self.torque_raw / 2047.0 * t_max,
-            temp_mos_c=self.temp_mos,
-            temp_rotor_c=self.temp_rotor,
+            self.esc_id, self.status, position, velocity, torque, self.temp_mos, self.temp_rotor
         )
 
 
@@ -80,13 +90,23 @@ def frame_zero(esc_id: int) -> tuple[int, bytes]:
     return esc_id, ZERO_FRAME
 
 
+# Bound Struct.pack, so streaming callers that already know the arbitration ID
+# (periodic demo tasks) pack each update without a Python-level call.
+pack_speed_payload = _SPEED_STRUCT.pack
+
+
 def frame_speed(esc_id: int, velocity_rad_s: float) -> tuple[int, bytes]:
-    payload = pack("<f", velocity_rad_s) + bytes(4)
-    return 0x200 + esc_id, payload
+    return 0x200 + esc_id, pack_speed_payload(velocity_rad_s)
+
+
+def frames_speed(esc_ids: Iterable[int], velocity_rad_s: float) -> list[tuple[int, bytes]]:
+    """Speed frames sending every ESC in *esc_ids* the same velocity, packed once."""
+    payload = pack_speed_payload(velocity_rad_s)
+    return [(0x200 + esc_id, payload) for esc_id in esc_ids]
 
 
 def frame_position_speed(esc_id: int, position_rad: float, velocity_rad_s: float) -> tuple[int, bytes]:
-    payload = pack("<ff", position_rad, velocity_rad_s)
+    payload = _POSITION_SPEED_STRUCT.pack(position_rad, velocity_rad_s)
     return 0x100 + esc_id, payload
 
 
@@ -134,13 +154,13 @@ def is_zero_payload(payload: bytes) -> bool:
 def unpack_speed_payload(payload: bytes) -> float:
     if len(payload) != 8:
         raise ValueError("Speed command payload must be 8 bytes")
-    return unpack("<f", payload[:4])[0]
+    return _SPEED_STRUCT.unpack(payload)[0]
 
 
 def unpack_position_speed_payload(payload: bytes) -> tuple[float, float]:
     if len(payload) != 8:
         raise ValueError("Position-speed payload must be 8 bytes")
-    position, velocity = unpack("<ff", payload)
+    position, velocity = _POSITION_SPEED_STRUCT.unpack(payload)
     return position, velocity
 
 
@@ -226,23 +246,12 @@ def decode_mit(
 def decode_feedback(data: bytes) -> Feedback:
     if len(data) != 8:
         raise ValueError("Feedback frame must be 8 bytes")
-    status_field = data[0]
-    esc_id = status_field & 0x0F
-    status = status_field >> 4
-    pos_raw = _to_signed(data[1] << 8 | data[2], bits=16)
-    vel_raw = _to_signed(((data[3] << 4) | (data[4] >> 4)) & 0xFFF, bits=12)
-    torque_raw = _to_signed(((data[4] & 0x0F) << 8) | data[5], bits=12)
-    temp_mos = data[6]
-    temp_rotor = data[7]
-    return Feedback(
-        esc_id=esc_id,
-        status=status,
-        position_raw=pos_raw,
-        velocity_raw=vel_raw,
-        torque_raw=torque_raw,
-        temp_mos=temp_mos,
-        temp_rotor=temp_rotor,
-    )
+    status_field, pos_raw, vel_hi, mixed, torque_lo, temp_mos, temp_rotor = _FEEDBACK_STRUCT.unpack(data)
+    # Sign-extend the packed 12-bit fields.
+    vel_raw = (((vel_hi << 4) | (mixed >> 4)) ^ 0x800) - 0x800
+    torque_raw = ((((mixed & 0x0F) << 8) | torque_lo) ^ 0x800) - 0x800
+    # Positional in field order: runs per received frame.
+    return Feedback(status_field & 0x0F, status_field >> 4, pos_raw, vel_raw, torque_raw, temp_mos, temp_rotor)
 
 
 def build_filters(mst_ids: Iterable[int]) -> list[dict[str, int]]:
@@ -309,11 +318,6 @@ def parse_management_response(data: bytes) -> ManagementResponse:
     return ManagementResponse(esc_id=esc_id, command=command, rid=rid, value=value)
 
 
-def _to_signed(value: int, *, bits: int) -> int:
-    sign_bit = 1 << (bits - 1)
-    return (value ^ sign_bit) - sign_bit
-
-
 def _float_to_uint(value: float, minimum: float, maximum: float, *, bits: int) -> int:
     if maximum <= minimum:
         raise ValueError("maximum must be greater than minimum")
@@ -343,11 +347,13 @@ __all__ = [
     "frame_disable",
     "frame_zero",
     "frame_speed",
+    "frames_speed",
     "frame_position_speed",
     "frame_mit",
     "is_enable_payload",
     "is_disable_payload",
     "is_zero_payload",
+    "pack_speed_payload",
     "unpack_speed_payload",
     "unpack_position_speed_payload",
     "pack_mit_payload",
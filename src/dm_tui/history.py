@@ -0,0 +1,69 @@
+"""Fixed-size telemetry history buffers."""
+
+from __future__ import annotations
+
+from array import array
+
+DEFAULT_HISTORY_CAPACITY = 200
+
+
+class TelemetryHistory:
+    """Ring buffer of recent samples for one motor, stored column-wise.
+
+    Each channel lives in its own preallocated array so appending a sample
+    only overwrites four slots and never allocates Python objects. Readings
+    are decoded from 12/16-bit fields, so they are stored as 32-bit floats;
+    timestamps keep double precision because monotonic seconds outgrow a
+    float32 mantissa within hours.
+    """
+
+    __slots__ = ("capacity", "timestamp", "velocity", "torque", "temp", "total", "_head", "_count")
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.timestamp = array("d", bytes(8 * capacity))
+        self.velocity = array("f", bytes(4 * capacity))
+        self.torque = array("f", bytes(4 * capacity))
+        self.temp = array("f", bytes(4 * capacity))
+        # Bumped on every append/clear so renderers can skip redraws when nothing changed.
+        self.total = 0
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, velocity: float, torque: float, temp: float) -> None:
+        """Record one sample, overwriting the oldest once the buffer is full."""
+
+        head = self._head
+        self.timestamp[head] = timestamp
+        self.velocity[head] = velocity
+        self.torque[head] = torque
+        self.temp[head] = temp
+        head += 1
+        self._head = 0 if head == self.capacity else head
+        if self._count < self.capacity:
+            self._count += 1
+        self.total += 1
+
+    def clear(self) -> None:
+        self.total += 1
+        self._head = 0
+        self._count = 0
+
+    def ordered(self, column: array) -> list[float]:
+        """Return *column* (one of this buffer's arrays) oldest sample first."""
+
+        if self._count < self.capacity:
+            return column[: self._count].tolist()
+        head = self._head
+        return column[head:].tolist() + column[:head].tolist()
+
+    def velocities(self) -> list[float]:
+        return self.ordered(self.velocity)
+
+
+__all__ = ["DEFAULT_HISTORY_CAPACITY", "TelemetryHistory"]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import csv
+import queue
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, TextIO
@@ -81,10 +83,10 @@ class TelemetryCsvWriter:
         self._handle.flush()
 
     def write_rows(self, rows: Iterable[TelemetryRow]) -> None:
-        """Append multiple telemetry *rows*."""
+        """Append multiple telemetry *rows*, flushing once at the end."""
 
-        for row in rows:
-            self.write_row(row)
+        self._writer.writerows(row.as_sequence() for row in rows)
+        self._handle.flush()
 
     def close(self) -> None:
         """Close the underlying file handle."""
@@ -94,6 +96,64 @@ class TelemetryCsvWriter:
             self._handle.close()
 
 
+class QueuedCsvWriter:
+    """Hand telemetry rows to a background thread that appends them to *writer*.
+
+    ``write_row`` only enqueues, so a stalled disk cannot block the UI thread.
+    Rows arriving while *max_pending* are already queued are dropped and counted
+    in ``dropped``. ``close`` drains the queue before closing *writer*.
+    """
+
+    __slots__ = ("_writer", "_queue", "_batch_size", "_thread", "_error", "dropped", "path")
+
+    def __init__(self, writer: TelemetryCsvWriter, *, max_pending: int = 4096, batch_size: int = 256) -> None:
+        self._writer = writer
+        self._queue: queue.Queue[TelemetryRow | None] = queue.Queue(max_pending)
+        self._batch_size = batch_size
+        self._error: Exception | None = None
+        self.dropped = 0
+        self.path = writer.path
+        self._thread = threading.Thread(target=self._drain, name="dm-tui-telemetry-log", daemon=True)
+        self._thread.start()
+
+    def write_row(self, row: TelemetryRow) -> None:
+        """Queue *row*; re-raises the writer thread's failure, if it had one."""
+
+        if self._error is not None:
+            raise self._error
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Write out queued rows, stop the writer thread and close *writer*."""
+
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._writer.close()
+
+    def _drain(self) -> None:
+        pending = self._queue
+        while True:
+            batch = [pending.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [row for row in batch if row is not None]
+            # Keep draining after a failure so close() never blocks on a full queue.
+            if rows and self._error is None:
+                try:
+                    self._writer.write_rows(rows)
+                except Exception as exc:  # pragma: no cover - depends on filesystem
+                    self._error = exc
+            if len(rows) != len(batch):
+                return
+
+
 def open_csv(path: Path) -> TelemetryCsvWriter:
     """Open *path* for appending telemetry rows, creating headers if needed."""
 
@@ -144,6 +204,7 @@ def telemetry_row_from_feedback(
 
 __all__ = [
     "CSV_HEADERS",
+    "QueuedCsvWriter",
     "TelemetryCsvWriter",
     "TelemetryRow",
     "open_csv",
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
+from threading import Lock
 from typing import Any, Iterable
 
 import yaml
@@ -11,6 +14,11 @@ import yaml
 DEFAULT_CONFIG_DIR = Path("~/.config/dm_tui").expanduser()
 DEFAULT_CONFIG_PATH = DEFAULT_CONFIG_DIR / "config.yaml"
 
+_CONFIG_CACHE_SIZE = 8
+# Parsed YAML keyed by (path, st_mtime_ns, st_size); guarded by _CONFIG_CACHE_LOCK.
+_CONFIG_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+_CONFIG_CACHE_LOCK = Lock()
+
 
 @dataclass(slots=True)
 class BusConfig:
@@ -69,17 +77,38 @@ class AppConfig:
         return cls(buses=buses, motors=motors, active_bus=active_bus, groups=groups)
 
 
-def load_config(path: Path | None = None) -> AppConfig:
-    """Load configuration from *path* or fall back to the default location."""
+def load_config(path: Path | None = None, *, use_cache: bool = True) -> AppConfig:
+    """Load configuration from *path* or fall back to the default location.
+
+    Parsed YAML is memoized by path, modification time and size so repeated
+    loads of an unchanged file skip the parser. Pass ``use_cache=False`` to
+    force a re-parse (the result still refreshes the cache).
+    """
     config_path = path or DEFAULT_CONFIG_PATH
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         # Ensure parent directory exists so saves succeed later.
         config_path.parent.mkdir(parents=True, exist_ok=True)
         return AppConfig()
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
-    return AppConfig.from_dict(data)
+    key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    data: dict[str, Any] | None = None
+    if use_cache:
+        with _CONFIG_CACHE_LOCK:
+            data = _CONFIG_CACHE.get(key)
+            if data is not None:
+                _CONFIG_CACHE.move_to_end(key)
+    if data is None:
+        with config_path.open("r", encoding="utf-8") as handle:
+            data = yaml.safe_load(handle) or {}
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[key] = data
+            _CONFIG_CACHE.move_to_end(key)
+            while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+    # Callers mutate the returned config, so never hand out cached objects.
+    return AppConfig.from_dict(deepcopy(data))
 
 
 def save_config(config: AppConfig, path: Path | None = None) -> None:
@@ -88,6 +117,21 @@ def save_config(config: AppConfig, path: Path | None = None) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with config_path.open("w", encoding="utf-8") as handle:
         yaml.safe_dump(config.to_dict(), handle, sort_keys=False)
+    invalidate_config_cache(config_path)
+
+
+def invalidate_config_cache(path: Path | None = None) -> None:
+    """Drop memoized parses of *path*, or of every file when *path* is ``None``.
+
+    Needed after writes because mtime alone may not change on fast rewrites.
+    """
+    with _CONFIG_CACHE_LOCK:
+        if path is None:
+            _CONFIG_CACHE.clear()
+            return
+        name = str(path)
+        for key in [key for key in _CONFIG_CACHE if key[0] == name]:
+            del _CONFIG_CACHE[key]
 
 
 def ensure_bus(
@@ -1,25 +1,49 @@
 import threading
 from time import monotonic
+from types import SimpleNamespace
 
 from typing import Iterable
 
 import pytest
 from rich.console import Console
+from textual.geometry import Region
 from textual.message_pump import active_app
+from textual.widget import Widget
 
 from dm_tui.app import (
+    REFRESH_CONTROL,
+    REFRESH_DETAIL,
+    REFRESH_GROUPS,
+    REFRESH_HINT,
+    REFRESH_TABLE,
+    REFRESH_TELEMETRY,
+    BusStatusPanel,
     DmTuiApp,
+    GroupPanel,
+    HintPanel,
+    IdAssignmentResult,
     MetadataUpdate,
     MitCommand,
     MitModal,
     MotorControlPanel,
+    MotorDetailPanel,
     MotorTable,
+    TelemetryPanel,
+    TelemetryRecord,
+    VelocitySparkline,
+    _coerce_positive,
+    _esc_hex,
+    _format_bitrate,
+    _mst_hex,
+    _parse_esc_ids,
+    _parse_id_token,
 )
 from dm_tui.discovery import MotorInfo
 from dm_tui.dmlib import params
 from dm_tui.dmlib import protocol
 from dm_tui.dmlib.protocol import Feedback
-from dm_tui.persistence import BusConfig, MotorRecord
+from dm_tui.history import TelemetryHistory
+from dm_tui.persistence import AppConfig, BusConfig, GroupRecord, MotorRecord, save_config
 from textual.widgets import Button
 
 
@@ -97,6 +121,64 @@ def test_motor_table_update_rows_handles_missing_records() -> None:
     assert row[2] == "--"
 
 
+def test_motor_table_update_rows_patches_changed_cells_only(monkeypatch) -> None:
+    table = MotorTable()
+    token = active_app.set(_DummyApp())
+    try:
+        table.add_columns("ESC", "MST", "Name", "Status", "Last Seen")
+        records = {1: MotorRecord(esc_id=1, mst_id=0x11, name="left"), 2: MotorRecord(esc_id=2, mst_id=0x12)}
+        table.update_rows({}, records, now=1.0)
+        updates: list[tuple[str, str]] = []
+        original_update_cell = table.update_cell
+
+        def record_update(row_key, column_key, value, **kwargs):
+            updates.append((row_key, value))
+            original_update_cell(row_key, column_key, value, **kwargs)
+
+        monkeypatch.setattr(table, "update_cell", record_update)
+        monkeypatch.setattr(table, "clear", lambda *args, **kwargs: pytest.fail("unexpected rebuild"))
+        table.update_rows({}, records, now=2.0)
+        records[2].name = "right"
+        table.update_rows({}, records, now=3.0)
+        row = table.get_row("2")
+    finally:
+        active_app.reset(token)
+
+    assert updates == [("2", "right")]
+    assert row[2] == "right"
+
+
+def test_motor_table_adds_and_removes_rows_without_clearing(monkeypatch) -> None:
+    table = MotorTable()
+    token = active_app.set(_DummyApp())
+    try:
+        table.add_columns("ESC", "MST", "Name", "Status", "Last Seen")
+        records = {esc_id: MotorRecord(esc_id=esc_id, mst_id=0x10 + esc_id) for esc_id in (1, 3, 4)}
+        table.update_rows({}, records, now=1.0)
+        monkeypatch.setattr(table, "clear", lambda *args, **kwargs: pytest.fail("unexpected rebuild"))
+        del records[4]
+        records[2] = MotorRecord(esc_id=2, mst_id=0x12)
+        changed = table.update_rows({}, records, now=2.0)
+        labels = [table.get_row_at(index)[0] for index in range(table.row_count)]
+    finally:
+        active_app.reset(token)
+
+    assert changed
+    assert labels == ["0x01", "0x02", "0x03"]
+    assert table.available_esc_ids() == [1, 2, 3]
+
+
+def test_motor_table_render_cells_classifies_age() -> None:
+    render = MotorTable._render_cells
+    record = MotorRecord(esc_id=1, mst_id=0x11)
+
+    assert render(1, record, None, None, 5.0, None, None)[3:] == ("Configured", "--")
+    assert render(1, record, MotorInfo(1, 0x11, 4.0), None, 5.0, None, None)[3:] == ("Active", "1.0s ago")
+    assert render(1, record, MotorInfo(1, 0x11, 2.5), None, 5.0, None, None)[3:] == ("Quiet", "2.5s ago")
+    # A last_seen slightly ahead of the sampled clock clamps to zero.
+    assert render(1, record, MotorInfo(1, 0x11, 5.2), None, 5.0, None, None)[3:] == ("Active", "0.0s ago")
+
+
 def test_mit_modal_parses_user_values() -> None:
     token = active_app.set(_DummyApp())
     try:
@@ -129,6 +211,57 @@ def test_mit_modal_parses_user_values() -> None:
     assert result.kd == 2.5
 
 
+def test_mit_modal_reports_all_invalid_fields() -> None:
+    token = active_app.set(_DummyApp())
+    try:
+        modal = MitModal(
+            1,
+            position_limit=2.0,
+            velocity_limit=3.0,
+            torque_limit=1.5,
+            kp_limit=100.0,
+            kd_limit=5.0,
+        )
+        modal._position_input = _StubInput("5")
+        modal._velocity_input = _StubInput("0.5")
+        modal._torque_input = _StubInput("")
+        modal._kp_input = _StubInput("stiff")
+        modal._kd_input = _StubInput("1")
+        errors: list[str] = []
+        modal._error = type("_Label", (), {"update": lambda self, text: errors.append(text)})()
+        modal.dismiss = lambda value: pytest.fail("invalid input must not dismiss")
+        modal.on_button_pressed(_StubButtonEvent("apply"))
+    finally:
+        active_app.reset(token)
+
+    assert errors == ["Position must be between -2.00 and 2.00.\nEnter a numeric Kp value."]
+
+
+def test_parse_esc_ids_accepts_hex_and_decimal_tokens() -> None:
+    assert _parse_esc_ids("0x01, 2 0X1a") == ([0x01, 2, 0x1A], None)
+    assert _parse_esc_ids("") == ([], None)
+    assert _parse_esc_ids("0x01 1a 0x03") == ([0x01], "1a")
+
+
+def test_parse_id_token_rejects_signs_and_separators() -> None:
+    assert _parse_id_token("0x7FF") == 0x7FF
+    assert _parse_id_token("17") == 17
+    assert _parse_id_token("-1") is None
+    assert _parse_id_token("1_0") is None
+
+
+def test_sanitize_mit_command_clamps_and_reports_fields(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+
+    sanitized, adjustments = app._sanitize_mit_command(
+        MitCommand(position_rad=3.0, velocity_rad_s=-0.5, torque_nm=-9.0, kp=-1.0, kd=1.0),
+        (2.0, 3.0, 1.5, 100.0, 5.0),
+    )
+
+    assert sanitized == MitCommand(2.0, -0.5, -1.5, 0.0, 1.0)
+    assert adjustments == ["position", "torque", "kp"]
+
+
 def test_reapply_filters_allows_management_frames(tmp_path) -> None:
     """Filters should always allow management responses used for RID reads."""
 
@@ -173,6 +306,28 @@ def test_reapply_filters_include_catch_all_during_discovery(tmp_path) -> None:
     } in bus.filters
 
 
+def test_reapply_filters_skips_unchanged_filter_set(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    bus = _StubBusManager()
+    app._bus_manager = bus  # type: ignore[assignment]
+    app._motor_records[0x01] = MotorRecord(esc_id=0x01, mst_id=0x101)
+
+    app._reapply_filters()
+    bus.filters = None
+    app._reapply_filters()
+    assert bus.filters is None
+
+    app._motor_records[0x02] = MotorRecord(esc_id=0x02, mst_id=0x102)
+    app._reapply_filters()
+    assert bus.filters is not None
+    assert {"can_id": 0x102, "can_mask": 0x7FF, "extended": 0} in bus.filters
+
+    other = _StubBusManager()
+    app._bus_manager = other  # type: ignore[assignment]
+    app._reapply_filters()
+    assert other.filters is not None
+
+
 def test_ingest_feedback_fetches_rid_limits(monkeypatch, tmp_path) -> None:
     app = DmTuiApp(config_path=tmp_path / "config.yaml")
     app._bus_manager = object()
@@ -188,14 +343,17 @@ def test_ingest_feedback_fetches_rid_limits(monkeypatch, tmp_path) -> None:
         params.RID_V_MAX: 7.0,
         params.RID_T_MAX: 3.5,
     }
-    read_calls: list[tuple[int, int]] = []
+    read_calls: list[tuple[int, tuple[int, ...]]] = []
 
-    def fake_read(_bus, esc_id: int, rid: int, timeout: float = 0.3) -> float:
-        read_calls.append((esc_id, rid))
-        return values[rid]
+    def fake_read(_bus, esc_id: int, rids, timeout: float = 0.3) -> list[float]:
+        read_calls.append((esc_id, tuple(rids)))
+        return [values[rid] for rid in rids]
 
     monkeypatch.setattr("dm_tui.app.refresh_params", fake_refresh)
-    monkeypatch.setattr("dm_tui.app.read_param_float", fake_read)
+    monkeypatch.setattr("dm_tui.app.read_param_floats", fake_read)
+    workers: list = []
+    app.run_worker = lambda work, **_kwargs: workers.append(work) or work()  # type: ignore[assignment]
+    app.call_from_thread = lambda callback, *args: callback(*args)  # type: ignore[assignment]
 
     feedback = Feedback(
         esc_id=0x01,
@@ -215,17 +373,290 @@ def test_ingest_feedback_fetches_rid_limits(monkeypatch, tmp_path) -> None:
     assert record.metadata["t_max"] == 3.5
     assert 0x01 in app._limits_loaded
     assert refreshed == [0x01]
-    assert read_calls == [
-        (0x01, params.RID_P_MAX),
-        (0x01, params.RID_V_MAX),
-        (0x01, params.RID_T_MAX),
-    ]
+    assert read_calls == [(0x01, (params.RID_P_MAX, params.RID_V_MAX, params.RID_T_MAX))]
+    assert len(workers) == 1
+    assert not app._limits_inflight
     telemetry = app._telemetry[0x01]
     assert telemetry.position_rad == pytest.approx(4.5, rel=1e-3)
     assert telemetry.velocity_rad_s == pytest.approx(7.0, rel=1e-3)
     assert telemetry.torque_nm == pytest.approx(3.5, rel=1e-3)
 
 
+def test_limits_fetch_failure_clears_inflight_entry(monkeypatch, tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._bus_manager = object()
+    logged: list[str] = []
+    app._log = logged.append  # type: ignore[method-assign]
+
+    def bad_reply(_bus, esc_id: int, rids, timeout: float = 0.3) -> list[float]:
+        raise ValueError("short reply")
+
+    monkeypatch.setattr("dm_tui.app.refresh_params", lambda _bus, _esc_id: None)
+    monkeypatch.setattr("dm_tui.app.read_param_floats", bad_reply)
+    app.run_worker = lambda work, **_kwargs: work()  # type: ignore[assignment]
+    app.call_from_thread = lambda callback, *args: callback(*args)  # type: ignore[assignment]
+
+    app._maybe_update_limits(MotorRecord(esc_id=0x02, mst_id=0x12))
+
+    assert not app._limits_inflight
+    assert 0x02 in app._limit_errors
+    assert "short reply" in logged[0]
+
+
+def test_sorted_esc_ids_cached_until_membership_changes(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._ensure_telemetry_log = lambda: None
+    app._log = lambda message: None
+    feedback = Feedback(
+        esc_id=0x03,
+        status=0,
+        position_raw=32767,
+        velocity_raw=2047,
+        torque_raw=2047,
+        temp_mos=30,
+        temp_rotor=32,
+    )
+
+    assert app._sorted_esc_ids() == []
+    app._ingest_feedback(0x03, feedback, mst_id=0x13, timestamp=1.0)
+    app._ingest_feedback(0x01, feedback, mst_id=0x11, timestamp=1.0)
+    cached = app._sorted_esc_ids()
+    assert cached == [0x01, 0x03]
+
+    app._ingest_feedback(0x01, feedback, mst_id=0x11, timestamp=2.0)
+    assert app._sorted_esc_ids() is cached
+
+
+def test_estop_disables_every_known_esc(monkeypatch, tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._log = lambda message: None
+    app._bus_manager = object()  # type: ignore[assignment]
+    app._motor_records[0x02] = MotorRecord(esc_id=0x02, mst_id=0x12)
+    app._motors[0x01] = MotorInfo(0x01, 0x11, 0.0)
+    app._esc_ids_dirty = True
+    disabled: list[list[int]] = []
+    monkeypatch.setattr("dm_tui.app.disable_all", lambda bus, esc_ids: disabled.append(list(esc_ids)))
+
+    app.action_estop()
+
+    assert disabled == [[0x01, 0x02]]
+
+
+def test_motor_table_refocus_skipped_when_rows_and_selection_unchanged(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    focused: list[int] = []
+
+    class _FakeTable:
+        rebuilt = True
+
+        def update_rows(self, *args, **kwargs) -> bool:
+            rebuilt, self.rebuilt = self.rebuilt, False
+            return rebuilt
+
+        def available_esc_ids(self) -> list[int]:
+            return [0x01, 0x02]
+
+        def focus_esc(self, esc_id: int) -> None:
+            focused.append(esc_id)
+
+    table = _FakeTable()
+    app.query_one = lambda *_args, **_kwargs: table  # type: ignore[assignment]
+
+    app._refresh_motor_table()
+    app._refresh_motor_table()
+    app.selected_esc = 0x02
+    app._refresh_motor_table()
+    app._refresh_motor_table()
+
+    assert focused == [0x01, 0x02]
+
+
+def test_feedback_updates_motor_state_in_place(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._ensure_telemetry_log = lambda: None
+    app._log = lambda _message: None
+    feedback = Feedback(esc_id=0x01, status=0, position_raw=0, velocity_raw=100, torque_raw=0, temp_mos=30, temp_rotor=30)
+
+    app._ingest_feedback(0x01, feedback, mst_id=0x11, timestamp=1.0)
+    info, record = app._motors[0x01], app._telemetry[0x01]
+    app._ingest_feedback(0x01, feedback, mst_id=0x12, timestamp=2.0)
+
+    assert app._motors[0x01] is info
+    assert app._telemetry[0x01] is record
+    assert (info.mst_id, info.last_seen, record.timestamp) == (0x12, 2.0, 2.0)
+
+
+def test_telemetry_panel_rows_are_cached_until_keys_change(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._ensure_telemetry_log = lambda: None
+    app._log = lambda _message: None
+    shown: list[tuple[int, ...]] = []
+
+    class _FakePanel:
+        MAX_ROWS = 2
+
+        def update_rows(self, telemetry, now, *, esc_ids) -> None:
+            shown.append(esc_ids)
+
+    app.query_one = lambda *_args, **_kwargs: _FakePanel()  # type: ignore[assignment]
+    feedback = Feedback(esc_id=0, status=0, position_raw=0, velocity_raw=0, torque_raw=0, temp_mos=30, temp_rotor=30)
+    for esc_id in (0x03, 0x02):
+        app._ingest_feedback(esc_id, feedback, mst_id=0x10 + esc_id, timestamp=1.0)
+
+    app._refresh_telemetry_panel(2.0)
+    app._ingest_feedback(0x03, feedback, mst_id=0x13, timestamp=2.0)
+    app._refresh_telemetry_panel(3.0)
+    app._ingest_feedback(0x01, feedback, mst_id=0x11, timestamp=3.0)
+    app._refresh_telemetry_panel(4.0)
+
+    assert shown == [(0x02, 0x03), (0x02, 0x03), (0x01, 0x02)]
+    assert shown[0] is shown[1]
+
+
+def test_feedback_refreshes_are_coalesced_until_flush(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._ensure_telemetry_log = lambda: None
+    app._log = lambda message: None
+    app.selected_esc = 0x01
+    app._mounted = True
+    refreshed: list[str] = []
+    app._refresh_motor_table = lambda now=None: refreshed.append("table")  # type: ignore[method-assign]
+    app._refresh_telemetry_panel = lambda now=None: refreshed.append("telemetry")  # type: ignore[method-assign]
+    app._refresh_detail_panel = lambda now=None: refreshed.append("detail")  # type: ignore[method-assign]
+    feedback = Feedback(
+        esc_id=0x01,
+        status=0,
+        position_raw=32767,
+        velocity_raw=2047,
+        torque_raw=2047,
+        temp_mos=30,
+        temp_rotor=32,
+    )
+
+    for step in range(5):
+        app._ingest_feedback(0x01, feedback, mst_id=0x11, timestamp=float(step))
+    assert refreshed == []
+
+    app._flush_telemetry_refresh()
+    app._flush_telemetry_refresh()
+    assert refreshed == ["table", "telemetry", "detail"]
+
+
+def test_ui_tick_drains_queued_bus_frames(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._ensure_telemetry_log = lambda: None
+    app._log = lambda message: None
+    frame = bytes([0x12, 0x80, 0x00, 0x7F, 0xF7, 0xFF, 30, 31])
+    app._rx_frames.extend([(frame, 0x12, 1.0), (b"\x00\x01", 0x7FF, 1.1), (frame, 0x12, 1.2)])
+
+    app._flush_telemetry_refresh()
+
+    assert not app._rx_frames
+    assert app._motors[0x02].mst_id == 0x12
+    assert app._telemetry[0x02].timestamp == 1.2
+    assert len(app._telemetry_history[0x02]) == 2
+
+
+def test_ui_tick_pauses_when_no_frames_are_queued(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    calls: list[str] = []
+    app._ui_refresh_timer = type(
+        "_Timer", (), {"pause": lambda self: calls.append("pause"), "resume": lambda self: calls.append("resume")}
+    )()
+
+    app._flush_telemetry_refresh()
+
+    assert calls == ["pause"]
+    assert app._ui_refresh_idle
+
+
+def test_mark_ui_dirty_wakes_paused_tick(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    calls: list[str] = []
+    app._ui_refresh_timer = type("_Timer", (), {"resume": lambda self: calls.append("resume")})()
+    app._ui_refresh_idle = True
+    refreshed: list[int] = []
+    app._refresh_panels = lambda panels: refreshed.append(panels)  # type: ignore[assignment]
+
+    app._mark_ui_dirty(REFRESH_TABLE)
+    app._mark_ui_dirty(REFRESH_DETAIL)
+    app._flush_telemetry_refresh()
+
+    assert calls == ["resume"]
+    assert refreshed == [REFRESH_TABLE | REFRESH_DETAIL]
+    assert app._ui_dirty == 0
+
+
+def test_text_panels_skip_unchanged_updates() -> None:
+    groups = GroupPanel()
+    bus = BusStatusPanel()
+    painted: list[str] = []
+    groups.update = painted.append  # type: ignore[method-assign]
+    bus.update = painted.append  # type: ignore[method-assign]
+    records = {"pair": GroupRecord(name="pair", esc_ids=[0x02, 0x01])}
+
+    groups.update_groups(records)
+    groups.update_groups(records)
+    bus.update_stats("can0", {"state": "UP"})
+    bus.update_stats("can0", {"state": "UP"})
+    bus.update_error("can0", "down")
+    bus.update_stats("can0", {"state": "UP"})
+
+    assert len(painted) == 4
+    assert painted[0].splitlines()[1] == "pair: 0x01, 0x02"
+
+
+def test_telemetry_panel_lists_lowest_esc_ids_in_order() -> None:
+    panel = TelemetryPanel()
+    painted: list[str] = []
+    panel.update = painted.append  # type: ignore[method-assign]
+    feedback = Feedback(0, 0, 0, 0, 0, 0, 0)
+    telemetry = {
+        esc_id: TelemetryRecord(feedback, 1.0, 0.0, 0.0, 0.0) for esc_id in (9, 3, 7, 1, 8, 2, 5, 4)
+    }
+
+    panel.update_rows(telemetry, now=1.5)
+
+    rows = painted[0].splitlines()[1:]
+    assert [row.split()[0] for row in rows] == ["0x01", "0x02", "0x03", "0x04", "0x05", "0x07"]
+
+
+def test_motor_detail_panel_renders_telemetry_block() -> None:
+    panel = MotorDetailPanel()
+    painted: list[str] = []
+    panel.update = painted.append  # type: ignore[method-assign]
+    telemetry = TelemetryRecord(Feedback(1, 0, 0, 0, 0, 41, 39), 9.5, 0.0, -1.234, 0.5)
+
+    panel.show_details(
+        esc_id=0x01,
+        record=MotorRecord(esc_id=0x01, mst_id=0x11, name="hip"),
+        info=MotorInfo(0x01, 0x11, 8.0),
+        telemetry=telemetry,
+        now=10.0,
+        watchdog_active=True,
+        watchdog_last=9.0,
+    )
+    panel.show_details(esc_id=0x02, record=None, info=None, telemetry=None, now=10.0)
+
+    assert painted[0].splitlines() == [
+        "[b]ESC[/b] 0x01 | [b]MST[/b] 0x011",
+        "[b]Name[/b] hip",
+        "[b]Group[/b] --",
+        "[b]Last Seen[/b] 2.0s ago",
+        "[b]Temps[/b] MOS 41°C | Rotor 39°C",
+        "[b]Velocity[/b] -1.23 rad/s",
+        "[b]Torque[/b] 0.50 Nm",
+        "[b]Telemetry[/b] Fresh (0.5s old)",
+        "[red]Watchdog auto-disable[/red] 1.0s ago.",
+    ]
+    assert painted[1].splitlines()[3:] == [
+        "[b]Last Seen[/b] --",
+        "[b]Temps[/b] --",
+        "[b]Velocity[/b] --",
+        "[b]Torque[/b] --",
+    ]
+
+
 def test_motor_control_panel_updates_and_disables() -> None:
     panel = MotorControlPanel()
     panel.update_controls(None, bus_online=False)
@@ -267,6 +698,208 @@ def test_motor_control_panel_button_invokes_action() -> None:
     assert stub.called == ["enable"]
 
 
+def test_motor_control_panel_calls_action_directly_on_ui_thread() -> None:
+    panel = MotorControlPanel()
+
+    class _StubApp:
+        def __init__(self) -> None:
+            self.called: list[str] = []
+            self.console = Console()
+            self._thread_id = threading.get_ident()
+
+        def call_from_thread(self, func):
+            raise AssertionError("should not hop threads")
+
+        def action_zero_selected(self) -> None:
+            self.called.append("zero")
+
+    stub = _StubApp()
+    token = active_app.set(stub)
+    try:
+        panel._app = stub  # type: ignore[attr-defined]
+        panel.on_button_pressed(Button.Pressed(panel._buttons["control-zero"]))
+    finally:
+        active_app.reset(token)
+
+    assert stub.called == ["zero"]
+
+
+def test_bus_switch_opens_only_the_last_selected_bus(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._mounted = True
+    app._refresh_hint_panel = lambda: None  # type: ignore[assignment]
+    app._refresh_control_panel = lambda: None  # type: ignore[assignment]
+    app._schedule_bus_stats_refresh = lambda: None  # type: ignore[assignment]
+    opened: list[str] = []
+    app._open_bus = opened.append  # type: ignore[assignment]
+    pending: list = []
+
+    class _FakeTimer:
+        def __init__(self, callback) -> None:
+            self.callback = callback
+            self.stopped = False
+            pending.append(self)
+
+        def stop(self) -> None:
+            self.stopped = True
+
+    app.set_timer = lambda delay, callback: _FakeTimer(callback)  # type: ignore[assignment]
+
+    app.watch_active_bus("canA")
+    app.watch_active_bus("canB")
+    for timer in pending:
+        if not timer.stopped:
+            timer.callback()
+
+    assert [timer.stopped for timer in pending] == [True, False]
+    assert opened == ["canB"]
+    assert app._config.active_bus == "canB"
+
+
+def test_refresh_panels_samples_clock_once_per_cycle(monkeypatch, tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    ticks = iter([10.0, 20.0, 30.0])
+    monkeypatch.setattr("dm_tui.app.monotonic", lambda: next(ticks))
+    seen: list[float] = []
+    app._refresh_motor_table = lambda now=None: seen.append(now)  # type: ignore[method-assign]
+    app._refresh_telemetry_panel = lambda now=None: seen.append(now)  # type: ignore[method-assign]
+    app._refresh_detail_panel = lambda now=None: seen.append(now)  # type: ignore[method-assign]
+
+    app._refresh_panels(REFRESH_TABLE | REFRESH_TELEMETRY | REFRESH_DETAIL)
+
+    assert seen == [10.0, 10.0, 10.0]
+
+
+def test_offscreen_panels_are_redrawn_once_revealed(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    calls: list[str] = []
+    for name in ("telemetry_panel", "group_panel", "hint_panel"):
+        setattr(app, f"_refresh_{name}", lambda *_args, name=name: calls.append(name))
+    app._offscreen_panels = REFRESH_HINT | REFRESH_TELEMETRY
+
+    app._refresh_panels(REFRESH_HINT | REFRESH_GROUPS)
+    assert calls == ["group_panel"]
+
+    # Every panel now fits: only the one that missed an update is redrawn.
+    app._widget = lambda _widget_type: SimpleNamespace(display=True, parent=None)  # type: ignore[method-assign]
+    app._update_panel_visibility()
+
+    assert calls == ["group_panel", "hint_panel"]
+    assert app._offscreen_panels == 0 and app._skipped_panels == 0
+
+
+def test_panel_clipped_by_its_column_is_marked_offscreen(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    calls: list[str] = []
+    for name in ("telemetry_panel", "group_panel", "hint_panel"):
+        setattr(app, f"_refresh_{name}", lambda *_args, name=name: calls.append(name))
+
+    class _Column(Widget):
+        region = Region(0, 0, 40, 20)
+
+    column = _Column()
+    panels = {
+        TelemetryPanel: SimpleNamespace(display=True, parent=column, region=Region(0, 0, 40, 10)),
+        GroupPanel: SimpleNamespace(display=True, parent=column, region=Region(0, 10, 40, 10)),
+        # Laid out below the bottom of the column, so nothing of it is visible.
+        HintPanel: SimpleNamespace(display=True, parent=column, region=Region(0, 20, 40, 5)),
+    }
+    app._widget = lambda widget_type: panels[widget_type]  # type: ignore[method-assign]
+    app._update_panel_visibility()
+    assert app._offscreen_panels == REFRESH_HINT
+
+    app._refresh_panels(REFRESH_TELEMETRY | REFRESH_HINT)
+    assert calls == ["telemetry_panel"]
+    assert app._skipped_panels == REFRESH_HINT
+
+
+def test_refresh_panels_runs_each_flagged_panel_once(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    calls: list[str] = []
+    for name in ("motor_table", "telemetry_panel", "detail_panel", "group_panel", "hint_panel", "control_panel"):
+        setattr(app, f"_refresh_{name}", lambda *_args, name=name: calls.append(name))
+
+    app._refresh_panels(REFRESH_HINT | REFRESH_DETAIL | REFRESH_CONTROL)
+    app._refresh_panels(REFRESH_TABLE | REFRESH_CONTROL)
+    app._refresh_panels(0)
+
+    assert calls == ["detail_panel", "hint_panel", "motor_table", "control_panel"]
+
+
+def test_id_assignment_renames_esc_inside_groups(monkeypatch, tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._bus_manager = object()  # type: ignore[assignment]
+    app._log = lambda _message: None
+    app._persist_config = lambda: None  # type: ignore[assignment]
+    app._reapply_filters = lambda: None  # type: ignore[assignment]
+    app._refresh_panels = lambda panels: None  # type: ignore[assignment]
+    monkeypatch.setattr("dm_tui.app.assign_motor_ids", lambda *args, **kwargs: None)
+    app.run_worker = lambda work, **_kwargs: work()  # type: ignore[assignment]
+    app.call_from_thread = lambda callback, *args: callback(*args)  # type: ignore[assignment]
+    app._motor_records[0x01] = MotorRecord(esc_id=0x01, mst_id=0x11)
+    app._groups = {
+        "arm": GroupRecord(name="arm", esc_ids=[0x03, 0x01]),
+        "leg": GroupRecord(name="leg", esc_ids=[0x04]),
+    }
+    leg_ids = app._groups["leg"].esc_ids
+
+    app._apply_id_assignment(0x01, IdAssignmentResult(esc_id=0x05, mst_id=0x15, control_mode=3))
+
+    assert app._groups["arm"].esc_ids == [0x03, 0x05]
+    assert app._groups["leg"].esc_ids is leg_ids
+    assert app._motor_records[0x05].mst_id == 0x15
+
+
+def test_log_lines_from_one_handler_are_written_together(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._mounted = True
+    scheduled: list = []
+    written: list[list[str]] = []
+    app.call_later = lambda callback: scheduled.append(callback)  # type: ignore[assignment]
+    app.query_one = lambda *_args: type("_Log", (), {"write_lines": lambda self, lines: written.append(lines)})()  # type: ignore[assignment]
+
+    app._log("first")
+    app._log("second")
+    assert len(scheduled) == 1
+    scheduled[0]()
+
+    assert len(written) == 1
+    assert [line.split("] ", 1)[1] for line in written[0]] == ["first", "second"]
+    assert app._log_pending == []
+
+
+def test_worker_log_messages_are_drained_in_one_callback(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    scheduled: list = []
+    app._loop = type("_Loop", (), {"call_soon_threadsafe": lambda self, callback: scheduled.append(callback)})()  # type: ignore[assignment]
+    messages: list[str] = []
+    app._log = lambda message: messages.append(message)
+
+    app._log_from_thread("first")
+    app._log_from_thread("second")
+    assert len(scheduled) == 1
+    scheduled[0]()
+    app._log_from_thread("third")
+
+    assert messages == ["first", "second"]
+    assert len(scheduled) == 2
+
+
+def test_cycle_bus_walks_configured_channels(tmp_path) -> None:
+    save_config(
+        AppConfig(buses=[BusConfig(channel="can0"), BusConfig(channel="can1")], active_bus="can1"),
+        tmp_path / "config.yaml",
+    )
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._log = lambda _message: None
+
+    assert app.active_bus == "can1"
+    app.action_cycle_bus()
+    assert app.active_bus == "can0"
+    app.action_cycle_bus()
+    assert app.active_bus == "can1"
+
+
 def test_metadata_update_refreshes_table(monkeypatch, tmp_path) -> None:
     """Metadata edits should push updates to the motor table immediately."""
 
@@ -279,13 +912,13 @@ def test_metadata_update_refreshes_table(monkeypatch, tmp_path) -> None:
     def fake_group_refresh() -> None:
         call_order.append("group")
 
-    def fake_detail_refresh() -> None:
+    def fake_detail_refresh(now=None) -> None:
         call_order.append("detail")
 
     def fake_persist() -> None:
         call_order.append("persist")
 
-    def fake_table_refresh() -> None:
+    def fake_table_refresh(now=None) -> None:
         call_order.append("refresh")
 
     app._refresh_group_panel = fake_group_refresh  # type: ignore[attr-defined]
@@ -303,6 +936,62 @@ def test_metadata_update_refreshes_table(monkeypatch, tmp_path) -> None:
     assert call_order.index("refresh") > call_order.index("persist")
 
 
+def test_metadata_update_moves_motor_between_groups(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._persist_config = lambda: None  # type: ignore[assignment]
+    app._refresh_group_panel = lambda: None  # type: ignore[assignment]
+    app._refresh_detail_panel = lambda now=None: None  # type: ignore[assignment]
+    app._log = lambda _message: None
+    app._groups = {
+        "left": GroupRecord(name="left", esc_ids=[0x01, 0x02]),
+        "all": GroupRecord(name="all", esc_ids=[0x01, 0x02, 0x03]),
+    }
+    untouched = app._groups["all"].esc_ids
+
+    app._apply_metadata_update(0x03, MetadataUpdate(name=None, group=None, p_max=None, v_max=None, t_max=None))
+    assert app._groups["all"].esc_ids is untouched
+
+    app._apply_metadata_update(0x01, MetadataUpdate(name=None, group="right", p_max=None, v_max=None, t_max=None))
+    assert app._groups["left"].esc_ids == [0x02]
+    assert app._groups["all"].esc_ids == [0x02, 0x03]
+    assert app._groups["right"].esc_ids == [0x01]
+
+
+def test_cleanup_empty_groups_prunes_in_place(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    groups = {
+        "left": GroupRecord(name="left", esc_ids=[0x01]),
+        "empty": GroupRecord(name="empty", esc_ids=[]),
+    }
+    app._groups = groups
+
+    app._cleanup_empty_groups()
+
+    assert app._groups is groups
+    assert list(groups) == ["left"]
+
+
+def test_discovery_saves_are_debounced_while_running(monkeypatch, tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    monkeypatch.setattr(DmTuiApp, "is_running", property(lambda self: True))
+    timers: list[object] = []
+    app.set_timer = lambda delay, callback: timers.append(callback) or object()  # type: ignore[method-assign]
+    saves: list[list[int]] = []
+    monkeypatch.setattr(
+        "dm_tui.app.save_config", lambda config, path: saves.append([m.esc_id for m in config.motors])
+    )
+    app._log = lambda _message: None
+
+    app._ingest_discovery([MotorInfo(0x01, 0x11, 0.0), MotorInfo(0x02, 0x12, 0.0)])
+    app._ingest_discovery([MotorInfo(0x03, 0x13, 0.0)])
+
+    assert saves == []
+    assert len(timers) == 1
+    timers[0]()
+    assert saves == [[0x01, 0x02, 0x03]]
+    assert app._persist_timer is None
+
+
 def test_watchdog_disables_stale_motor(monkeypatch, tmp_path) -> None:
     """Watchdog should disable stale motors and annotate state."""
 
@@ -356,27 +1045,45 @@ def test_watchdog_respects_cooldown(monkeypatch, tmp_path) -> None:
     assert 0x02 in app._watchdog_tripped
 
 
-def test_schedule_bus_stats_refresh_starts_single_worker(monkeypatch, tmp_path) -> None:
+def test_watchdog_heap_tracks_one_entry_per_motor(monkeypatch, tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._bus_manager = object()
+    app._watchdog_threshold = 0.5
+    app._watchdog_cooldown = 5.0
+    now = monotonic()
+    app._motors[0x01] = MotorInfo(0x01, 0x101, now + 60.0)
+    app._motors[0x02] = MotorInfo(0x02, 0x102, now - 10.0)
+    app._log = lambda _message: None
+    calls: list[int] = []
+    monkeypatch.setattr("dm_tui.app.disable", lambda _manager, esc_id: calls.append(esc_id))
+
+    app._watchdog_check()
+    app._watchdog_check()
+
+    assert calls == [0x02]
+    assert app._watchdog_tripped == {0x02}
+    assert len(app._watchdog_heap) == 2
+
+    app._motors[0x02] = MotorInfo(0x02, 0x102, now + 60.0)
+    app._watchdog_check()
+
+    assert app._watchdog_tripped == set()
+
+
+def test_schedule_bus_stats_refresh_starts_single_worker(tmp_path) -> None:
     app = DmTuiApp(config_path=tmp_path / "config.yaml")
     app._mounted = True
-    app._bus_stats_running = False
 
     start_counter = 0
     counter_lock = threading.Lock()
 
-    class DummyThread:
-        def __init__(self, *args, **kwargs) -> None:
-            self._target = kwargs.get("target")
-            if args:
-                self._target = args[0]
-
-        def start(self) -> None:
-            nonlocal start_counter
-            with counter_lock:
-                start_counter += 1
+    def fake_run_worker(work, **kwargs) -> None:
+        nonlocal start_counter
+        assert kwargs["thread"] is True
+        with counter_lock:
+            start_counter += 1
 
-    real_thread_cls = threading.Thread
-    monkeypatch.setattr("dm_tui.app.threading.Thread", DummyThread)
+    app.run_worker = fake_run_worker  # type: ignore[assignment]
 
     ready = threading.Barrier(3)
     done = threading.Barrier(3)
@@ -386,7 +1093,7 @@ def test_schedule_bus_stats_refresh_starts_single_worker(monkeypatch, tmp_path)
         app._schedule_bus_stats_refresh()
         done.wait()
 
-    workers = [real_thread_cls(target=invoke) for _ in range(2)]
+    workers = [threading.Thread(target=invoke) for _ in range(2)]
     for worker in workers:
         worker.start()
 
@@ -399,6 +1106,43 @@ def test_schedule_bus_stats_refresh_starts_single_worker(monkeypatch, tmp_path)
     assert start_counter == 1
 
 
+def test_schedule_discovery_runs_one_threaded_worker(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._mounted = True
+    app._bus_manager = object()  # type: ignore[assignment]
+    app._reapply_filters = lambda: None  # type: ignore[assignment]
+    started: list[dict] = []
+    app.run_worker = lambda work, **kwargs: started.append(kwargs)  # type: ignore[assignment]
+
+    app._schedule_discovery()
+    app._schedule_discovery(force_active=True)
+
+    assert [kwargs["group"] for kwargs in started] == ["discovery"]
+    assert started[0]["thread"] is True
+    assert app._discovery_running
+
+
+def test_schedule_failures_release_worker_gates(tmp_path) -> None:
+    app = DmTuiApp(config_path=tmp_path / "config.yaml")
+    app._mounted = True
+    app._bus_manager = object()  # type: ignore[assignment]
+    app._reapply_filters = lambda: None  # type: ignore[assignment]
+
+    def failing_run_worker(work, **_kwargs) -> None:
+        raise RuntimeError("no event loop")
+
+    app.run_worker = failing_run_worker  # type: ignore[assignment]
+
+    with pytest.raises(RuntimeError):
+        app._schedule_discovery()
+    with pytest.raises(RuntimeError):
+        app._schedule_bus_stats_refresh()
+
+    assert not app._discovery_running
+    assert not app._discovery_lock.locked()
+    assert not app._bus_stats_lock.locked()
+
+
 def test_get_commands_includes_motor_controls(tmp_path) -> None:
     app = DmTuiApp(config_path=tmp_path / "config.yaml")
     prompts = [command.prompt for command in app.get_commands()]
@@ -406,3 +1150,83 @@ def test_get_commands_includes_motor_controls(tmp_path) -> None:
     assert "Disable Selected" in prompts
     assert "Zero Selected" in prompts
     assert "Set Velocity" in prompts
+
+
+def test_reload_config_worker_applies_disk_changes(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    app = DmTuiApp(config_path=config_path)
+    save_config(
+        AppConfig(
+            motors=[MotorRecord(esc_id=0x01, mst_id=0x11, name="left")],
+            groups=[GroupRecord(name="pair", esc_ids=[0x01])],
+        ),
+        config_path,
+    )
+    messages: list[str] = []
+    app._log = lambda message: messages.append(message)
+    app.call_from_thread = lambda func, *args: func(*args)  # type: ignore[method-assign]
+
+    app._reload_config_worker()
+
+    assert app._motor_records[0x01].name == "left"
+    assert app._groups["pair"].esc_ids == [0x01]
+    assert messages == ["Configuration reloaded (motors +0x01)."]
+
+
+def test_reload_config_skips_refresh_when_unchanged(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    save_config(AppConfig(motors=[MotorRecord(esc_id=0x01, mst_id=0x11)]), config_path)
+    app = DmTuiApp(config_path=config_path)
+    messages: list[str] = []
+    refreshed: list[str] = []
+    app._log = lambda message: messages.append(message)
+    app.call_from_thread = lambda func, *args: func(*args)  # type: ignore[method-assign]
+    app._mounted = True
+    app._refresh_motor_table = lambda now=None: refreshed.append("table")  # type: ignore[method-assign]
+    app._refresh_detail_panel = lambda now=None: refreshed.append("detail")  # type: ignore[method-assign]
+    app._refresh_group_panel = lambda: refreshed.append("groups")  # type: ignore[method-assign]
+
+    app._reload_config_worker()
+
+    assert refreshed == []
+    assert messages == ["Configuration unchanged."]
+
+
+def test_bus_status_bitrate_formats_as_kbps() -> None:
+    assert _format_bitrate(1_000_000) == "1000 kbps"
+    assert _format_bitrate(83_333) == "83.333 kbps"
+    assert _format_bitrate(None) == "--"
+
+
+def test_coerce_positive_accepts_numbers_and_numeric_strings() -> None:
+    assert _coerce_positive(12.5, 1.0) == 12.5
+    assert _coerce_positive(3, 1.0) == 3.0
+    assert _coerce_positive("4.5", 1.0) == 4.5
+    assert _coerce_positive(None, 1.0) == 1.0
+    assert _coerce_positive("fast", 1.0) == 1.0
+    assert _coerce_positive(-2.0, 1.0) == 1.0
+    assert _coerce_positive(float("nan"), 1.0) == 1.0
+
+
+def test_hex_labels_match_format_inside_and_outside_table() -> None:
+    assert _esc_hex(0x01) == "0x01"
+    assert _esc_hex(0xC8) == "0xC8"
+    assert _esc_hex(0x1A5) == "0x1A5"
+    assert _mst_hex(0x011) == "0x011"
+    assert _mst_hex(0x1234) == "0x1234"
+
+
+def test_velocity_sparkline_skips_unchanged_history(monkeypatch) -> None:
+    panel = VelocitySparkline()
+    rendered: list[list[float]] = []
+    monkeypatch.setattr(panel, "update_series", lambda esc_id, values: rendered.append(values))
+    history = TelemetryHistory(capacity=4)
+    history.append(0.0, 1.0, 0.0, 30.0)
+
+    panel.show_history(1, history)
+    panel.show_history(1, history)
+    history.append(0.1, 2.0, 0.0, 30.0)
+    panel.show_history(1, history)
+    panel.show_history(None, None)
+
+    assert rendered == [[1.0], [1.0, 2.0], []]
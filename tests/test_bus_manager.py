@@ -0,0 +1,42 @@
+import threading
+
+import can
+
+from dm_tui.bus_manager import BusManager
+
+
+def test_send_many_sends_frames_in_order() -> None:
+    receiver = can.Bus(channel="dm-tui-send-many", interface="virtual")
+    manager = BusManager(channel="dm-tui-send-many", interface="virtual")
+    try:
+        manager.open()
+        manager.send_many([(0x201, bytes(8)), (0x202, bytes([1] * 8))])
+        first = receiver.recv(timeout=1.0)
+        second = receiver.recv(timeout=1.0)
+    finally:
+        manager.close()
+        receiver.shutdown()
+
+    assert first is not None and second is not None
+    assert (first.arbitration_id, bytes(first.data)) == (0x201, bytes(8))
+    assert (second.arbitration_id, bytes(second.data)) == (0x202, bytes([1] * 8))
+
+
+def test_send_many_holds_send_lock_for_whole_burst() -> None:
+    manager = BusManager(channel="dm-tui-send-lock", interface="virtual")
+    blocked: list[bool] = []
+
+    class _RecordingBus:
+        def send(self, message) -> None:
+            # Another thread must not be able to take the send lock mid-burst.
+            probe = threading.Thread(
+                target=lambda: blocked.append(not manager._send_lock.acquire(timeout=0.01))
+            )
+            probe.start()
+            probe.join()
+
+    manager._bus = _RecordingBus()  # type: ignore[assignment]
+    manager.send_many([(0x201, bytes(8)), (0x202, bytes(8))])
+    manager.send(0x203, bytes(8))
+
+    assert blocked == [True, True, True]
@@ -9,9 +9,12 @@ from dm_tui.controllers import (
     command_mit,
     command_mit_targets,
     command_velocity,
+    command_velocity_all,
     disable,
+    disable_all,
     enable,
     read_param,
+    read_params,
     refresh_params,
     write_param,
     zero,
@@ -27,6 +30,10 @@ class FakeBus:
     def send(self, arb_id, data, **kwargs):
         self.sent.append((arb_id, data))
 
+    def send_many(self, frames, **kwargs):
+        for arb_id, data in frames:
+            self.send(arb_id, data, **kwargs)
+
     def get_message(self, timeout=None):
         if self._messages:
             return self._messages.pop(0)
@@ -54,6 +61,22 @@ def test_command_velocity_targets_correct_arbitration_id():
     assert len(data) == 8
 
 
+def test_group_commands_go_out_as_one_burst():
+    bursts = []
+
+    class BurstBus(FakeBus):
+        def send_many(self, frames, **kwargs):
+            bursts.append(list(frames))
+
+    bus = BurstBus()
+    command_velocity_all(bus, [1, 2], -0.5)
+    disable_all(bus, [1, 2])
+
+    assert [[arb_id for arb_id, _ in burst] for burst in bursts] == [[0x201, 0x202], [1, 2]]
+    assert bursts[0][0][1] == protocol.frame_speed(1, -0.5)[1]
+    assert not bus.sent
+
+
 def test_command_mit_targets_correct_arbitration_id():
     bus = FakeBus()
     command_mit(
@@ -115,6 +138,23 @@ def test_read_param_timeout_raises_bus_manager_error():
         read_param(bus, 0x11, 0x07, timeout=0.05)
 
 
+def test_read_params_sends_all_requests_before_waiting():
+    responses = [
+        bytes([0x11, 0x00, params.MANAGEMENT_READ, rid, value, 0x00, 0x00, 0x00])
+        for rid, value in ((0x08, 0x02), (0x07, 0x01))
+    ]
+    messages = [
+        SimpleNamespace(arbitration_id=protocol.MANAGEMENT_ARBITRATION_ID, data=data) for data in responses
+    ]
+    bus = FakeBus(messages)
+    values = read_params(bus, 0x11, (0x07, 0x08), timeout=0.1)
+    assert values == [0x01, 0x02]
+    assert len(bus.sent) == 2
+
+    with pytest.raises(BusManagerError, match="0x09"):
+        read_params(FakeBus([]), 0x11, (0x09,), timeout=0.05)
+
+
 def test_refresh_params_targets_management_channel():
     bus = FakeBus()
     refresh_params(bus, 0x05)
@@ -4,7 +4,7 @@ import time
 
 import pytest
 
-from dm_tui.demos import brake_to_zero, sine_orchestra
+from dm_tui.demos import _phase_offsets, brake_to_zero, sine_orchestra
 
 
 class FakePeriodicTask:
@@ -39,6 +39,10 @@ class FakeBus:
     def send(self, arbitration_id: int, data: bytes, *, extended_id: bool = False) -> None:
         self.sent_frames.append((arbitration_id, data, extended_id))
 
+    def send_many(self, frames, *, extended_id: bool = False) -> None:
+        for arbitration_id, data in frames:
+            self.send(arbitration_id, data, extended_id=extended_id)
+
 
 def _extract_velocity(payload: bytes) -> float:
     return struct.unpack("<f", payload[:4])[0]
@@ -65,12 +69,39 @@ def test_sine_orchestra_schedules_periodic_updates() -> None:
     assert handle.updater is not None and not handle.updater.is_alive()
 
 
+def test_sine_orchestra_updates_follow_phase_offsets(monkeypatch) -> None:
+    # Freeze the clock: start at 0 s, every tick at 0.3 s, so each update has a known phase.
+    clock = iter([0.0])
+    monkeypatch.setattr("dm_tui.demos.monotonic", lambda: next(clock, 0.3))
+    bus = FakeBus()
+    handle = sine_orchestra(bus, [0x01, 0x02, 0x03], amplitude_rps=5.0, frequency_hz=0.5, mode="sine")
+    try:
+        deadline = time.monotonic() + 2.0
+        while not all(task.update_calls for task in bus.periodic_tasks) and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        handle.stop()
+
+    phase = 2 * math.pi * 0.5 * 0.3
+    for task, offset in zip(bus.periodic_tasks, _phase_offsets("sine", 3)):
+        assert task.update_calls
+        expected = 5.0 * math.sin(phase + offset)
+        assert all(_extract_velocity(data) == pytest.approx(expected, abs=1e-5) for data in task.update_calls)
+
+
 def test_sine_orchestra_requires_non_empty_ids() -> None:
     bus = FakeBus()
     with pytest.raises(ValueError):
         sine_orchestra(bus, [], amplitude_rps=1.0, frequency_hz=0.5)
 
 
+def test_phase_offsets_match_demo_modes() -> None:
+    assert _phase_offsets("sine", 4) == pytest.approx((0.0, math.pi / 2, math.pi, 3 * math.pi / 2))
+    assert _phase_offsets("antiphase", 3) == (0.0, math.pi, 0.0)
+    assert _phase_offsets("figure8", 2) == (0.0, math.pi / 2)
+    assert _phase_offsets("sine", 1) == (0.0,)
+
+
 def test_brake_to_zero_sends_zero_velocity_frames() -> None:
     bus = FakeBus()
     brake_to_zero(bus, [0x03, 0x04])
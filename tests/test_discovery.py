@@ -1,6 +1,7 @@
+from time import monotonic
 from types import SimpleNamespace
 
-from dm_tui.discovery import active_probe
+from dm_tui.discovery import active_probe, passive_sniff
 
 
 def _feedback_frame(esc_id: int) -> bytes:
@@ -34,3 +35,12 @@ def test_active_probe_identifies_motor():
     assert entry.esc_id == 2
     assert entry.mst_id == 0x12
     assert bus.sent[0][0] == 2  # disable frame to ESC ID
+
+
+def test_passive_sniff_dedupes_and_stamps_last_seen():
+    frame = _feedback_frame(esc_id=3)
+    bus = FakeBus([SimpleNamespace(arbitration_id=0x13, data=frame) for _ in range(3)])
+    start = monotonic()
+    discovered = passive_sniff(bus, duration=0.05)
+    assert [(entry.esc_id, entry.mst_id) for entry in discovered] == [(3, 0x13)]
+    assert start <= discovered[0].last_seen <= monotonic()
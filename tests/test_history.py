@@ -0,0 +1,45 @@
+"""Tests for the telemetry history ring buffer."""
+
+from __future__ import annotations
+
+import pytest
+
+from dm_tui.history import TelemetryHistory
+
+
+def test_history_returns_samples_in_arrival_order() -> None:
+    history = TelemetryHistory(capacity=4)
+    for index in range(3):
+        history.append(float(index), index * 1.5, -index, 30 + index)
+
+    assert len(history) == 3
+    assert history.velocities() == [0.0, 1.5, 3.0]
+    assert history.ordered(history.temp) == [30.0, 31.0, 32.0]
+
+
+def test_history_overwrites_oldest_when_full() -> None:
+    history = TelemetryHistory(capacity=3)
+    for index in range(5):
+        history.append(float(index), float(index), 0.0, 0.0)
+
+    assert len(history) == 3
+    assert history.velocities() == [2.0, 3.0, 4.0]
+    assert history.ordered(history.timestamp) == [2.0, 3.0, 4.0]
+
+    history.clear()
+    assert history.velocities() == []
+
+
+def test_history_rejects_non_positive_capacity() -> None:
+    with pytest.raises(ValueError):
+        TelemetryHistory(capacity=0)
+
+
+def test_history_keeps_timestamp_precision() -> None:
+    history = TelemetryHistory(capacity=2)
+    # float32 would round this to 1000000.0; only a double column keeps the millisecond.
+    history.append(1_000_000.001, 0.5, 0.0, 0.0)
+
+    assert history.timestamp.typecode == "d"
+    assert history.ordered(history.timestamp) == [1_000_000.001]
+    assert history.velocity.itemsize == 4
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import threading
 from pathlib import Path
 
 import pytest
@@ -126,3 +127,37 @@ def test_dm_tui_app_writes_telemetry_log(tmp_path: Path) -> None:
     assert float(row["velocity_rad_s"]) == pytest.approx(engineering.velocity_rad_s)
     assert float(row["torque_nm"]) == pytest.approx(engineering.torque_nm)
 
+
+def test_queued_writer_drops_rows_beyond_pending_limit(tmp_path: Path) -> None:
+    entered = threading.Event()
+    release = threading.Event()
+    written: list[telemetry_logging.TelemetryRow] = []
+
+    class _BlockingWriter:
+        path = tmp_path / "telemetry.csv"
+
+        def write_rows(self, rows) -> None:
+            entered.set()
+            release.wait()
+            written.extend(rows)
+
+        def close(self) -> None:
+            pass
+
+    writer = telemetry_logging.QueuedCsvWriter(_BlockingWriter(), max_pending=2)  # type: ignore[arg-type]
+    rows = [
+        telemetry_logging.TelemetryRow(float(index), 1, 0x011, 0, 0.0, 0.0, 0.0, 20.0, 21.0)
+        for index in range(6)
+    ]
+    # The drain thread takes the first row and blocks inside write_rows, so the
+    # queue then holds exactly max_pending rows and the rest are dropped.
+    writer.write_row(rows[0])
+    assert entered.wait(timeout=5.0)
+    for row in rows[1:]:
+        writer.write_row(row)
+    assert writer.dropped == 3
+
+    release.set()
+    writer.close()
+
+    assert written == rows[:3]
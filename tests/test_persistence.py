@@ -42,3 +42,38 @@ def test_ensure_bus_can_make_channel_active():
     ensure_bus(config, "canA", make_active=True)
     assert any(bus.channel == "canA" for bus in config.buses)
     assert config.active_bus == "canA"
+
+
+def test_load_config_cache_returns_independent_copies(tmp_path: Path, monkeypatch):
+    cfg_path = tmp_path / "config.yaml"
+    save_config(AppConfig(motors=[MotorRecord(esc_id=1, mst_id=0x11)]), cfg_path)
+    first = load_config(cfg_path)
+
+    def fail_parse(_handle):
+        raise AssertionError("cached load should not re-parse")
+
+    monkeypatch.setattr("dm_tui.persistence.yaml.safe_load", fail_parse)
+    second = load_config(cfg_path)
+    first.motors[0].metadata["p_max"] = 1.0
+
+    assert second.motors[0].esc_id == 1
+    assert second.motors[0].metadata == {}
+
+
+def test_load_config_reparses_after_save(tmp_path: Path):
+    cfg_path = tmp_path / "config.yaml"
+    save_config(AppConfig(active_bus="canA", buses=[BusConfig(channel="canA")]), cfg_path)
+    assert load_config(cfg_path).active_bus == "canA"
+
+    save_config(AppConfig(active_bus="canB"), cfg_path)
+    assert load_config(cfg_path).active_bus == "canB"
+
+
+def test_load_config_missing_file_recreates_deleted_directory(tmp_path: Path):
+    cfg_path = tmp_path / "nested" / "config.yaml"
+    assert load_config(cfg_path).motors == []
+    assert cfg_path.parent.is_dir()
+
+    cfg_path.parent.rmdir()
+    assert load_config(cfg_path).active_bus == "canB"
+    assert cfg_path.parent.is_dir()
@@ -36,6 +36,27 @@ def test_decode_feedback_round_trip():
     assert abs(engineering.velocity_rad_s - (feedback.velocity_raw / 2047.0 * 30.0)) < 1e-6
 
 
+def test_feedback_scaled_matches_engineering_values():
+    feedback = protocol.decode_feedback(
+        _encode_feedback(status=0, esc_id=3, pos=-0x4000, vel=0x400, torque=-0x100, mos=30, rotor=31)
+    )
+    engineering = feedback.to_engineering(p_max=12.5, v_max=45.0, t_max=18.0)
+    assert feedback.scaled(p_max=12.5, v_max=45.0, t_max=18.0) == (
+        engineering.position_rad,
+        engineering.velocity_rad_s,
+        engineering.torque_nm,
+    )
+
+
+def test_decode_feedback_sign_extends_negative_fields():
+    frame = _encode_feedback(status=0, esc_id=1, pos=-2, vel=-1, torque=0x7FF, mos=0, rotor=255)
+    feedback = protocol.decode_feedback(frame)
+    assert feedback.position_raw == -2
+    assert feedback.velocity_raw == -1
+    assert feedback.torque_raw == 0x7FF
+    assert feedback.temp_rotor == 255
+
+
 def test_frame_builders_have_correct_length():
     _, enable_data = protocol.frame_enable(1)
     assert len(enable_data) == 8
@@ -52,6 +73,12 @@ def test_frame_builders_have_correct_length():
     assert len(read_payload) == 8
 
 
+def test_pack_speed_payload_matches_frame_speed():
+    arb_id, payload = protocol.frame_speed(0x05, -2.5)
+    assert arb_id == 0x205
+    assert protocol.pack_speed_payload(-2.5) == payload
+
+
 def test_frame_mit_round_trip_preserves_values():
     limits = dict(
         position_limit=5.0,